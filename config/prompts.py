@@ -6,11 +6,13 @@ Project-level prompts and temperature settings.
 These override built-in defaults in `src/showroom_tool/config/defaults.py`.
 """
 
+from typing import Final
+
 # Per-action temperatures (project defaults; can be adjusted)
-SHOWROOM_SUMMARY_TEMPERATURE = 0.1
+SHOWROOM_SUMMARY_TEMPERATURE: Final[float] = 0.1
 
 # Base system prompt for ShowroomSummary generation
-SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT = """You are an expert technical content analyst specializing in analyzing Red Hat hands-on laboratory exercises and demo content. Your role is to analyze Showroom lab repositories and extract specific structured information.
+SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT: Final[str] = """You are an expert technical content analyst specializing in analyzing Red Hat hands-on laboratory exercises and demo content. Your role is to analyze Showroom lab repositories and extract specific structured information.
 
 ANALYSIS FOCUS:
 - Identify Red Hat products explicitly mentioned in the content (not implied or assumed)
@@ -27,10 +29,10 @@ CRITICAL INSTRUCTIONS:
 Be precise, accurate, and focus only on information that is clearly stated or directly demonstrated in the lab content."""
 
 
-SHOWROOM_REVIEW_TEMPERATURE = 0.1
+SHOWROOM_REVIEW_TEMPERATURE: Final[float] = 0.1
 
 # Base system prompt for ShowroomReview generation
-SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT = """You are an expert technical content reviewer specializing in evaluating Red Hat hands-on laboratory exercises and demo content. Your role is to provide constructive, detailed feedback on Showroom lab repositories across multiple quality dimensions.
+SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT: Final[str] = """You are an expert technical content reviewer specializing in evaluating Red Hat hands-on laboratory exercises and demo content. Your role is to provide constructive, detailed feedback on Showroom lab repositories across multiple quality dimensions.
 
 REVIEW FOCUS:
 - Completeness: Assess if the content covers all necessary topics and provides complete learning experiences
@@ -52,10 +54,10 @@ CRITICAL INSTRUCTIONS:
 - Ensure feedback is actionable and helpful for content creators
 - Maintain professional, constructive tone throughout"""
 
-SHOWROOM_DESCRIPTION_TEMPERATURE = 0.1
+SHOWROOM_DESCRIPTION_TEMPERATURE: Final[float] = 0.1
 
 # Base system prompt for CatalogDescription generation
-SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT = """You are an expert technical catalog writer specializing in creating compelling catalog entries for Red Hat hands-on laboratory exercises and demo content. Your role is to analyze Showroom lab repositories and generate structured catalog descriptions.
+SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT: Final[str] = """You are an expert technical catalog writer specializing in creating compelling catalog entries for Red Hat hands-on laboratory exercises and demo content. Your role is to analyze Showroom lab repositories and generate structured catalog descriptions.
 
 ANALYSIS FOCUS:
 - Headline: Create a compelling, concise summary that captures the lab's core value proposition
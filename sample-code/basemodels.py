@@ -1,7 +1,7 @@
 import operator
-from typing import Annotated, Any, Literal, TypedDict
+from typing import Annotated, Any, ClassVar, Literal, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 # =============================================
 # Dynamic Content Type Registry
@@ -10,6 +10,9 @@ from pydantic import BaseModel, Field
 
 # Strict processing metadata model for OpenAI structured outputs
 class ProcessingMetadata(BaseModel):
+    # A str, not a datetime: this model is part of the response schema, and an
+    # odd timestamp from the provider must not fail the whole parse. The tool
+    # overwrites it with the completion time after parsing
     timestamp: str = Field(..., description="ISO timestamp of processing")
     llm_provider: str = Field(..., description="LLM provider used")
     model_name: str = Field(..., description="Model name used")
@@ -26,15 +29,21 @@ class ProcessingMetadata(BaseModel):
 class BaseContentSummary(BaseModel):
     """Base class for all content summaries with common fields."""
 
+    # Build the core schema on first use, not at import (inherited by subclasses)
+    model_config = ConfigDict(defer_build=True)
+
+    # Fields filled in by the tool rather than extracted by the LLM
+    _AVOID_PROCESSING: ClassVar[frozenset[str]] = frozenset(
+        {"content_type", "processing_metadata"}
+    )
+
     content_type: str = Field(
         ...,
         description="Type of content (meeting, news, tutorial, general)",
-        avoid_processing=True,
     )
     processing_metadata: ProcessingMetadata = Field(
         ...,
         description="Processing metadata including: timestamp, llm_provider, model_name, model_version, processing_duration, etc.",
-        avoid_processing=True,
     )
 
 
@@ -236,11 +245,61 @@ ALLOWED_CONTENT_MODELS = {
 # =============================================
 
 
+class StrHint(BaseModel):
+    kind: Literal["str"] = "str"
+    value: str
+
+
+class ListStrHint(BaseModel):
+    kind: Literal["list_str"] = "list_str"
+    value: list[str]
+
+
+class DictHint(BaseModel):
+    kind: Literal["dict"] = "dict"
+    value: dict[str, str]
+
+
+class ListDictHint(BaseModel):
+    kind: Literal["list_dict"] = "list_dict"
+    value: list[dict[str, str]]
+
+
+# Tagged so pydantic dispatches on `kind` instead of trying every branch
+HintData = Annotated[
+    StrHint | ListStrHint | DictHint | ListDictHint, Field(discriminator="kind")
+]
+
+
+_HINT_KINDS = frozenset({"str", "list_str", "dict", "list_dict"})
+
+
+def _is_tagged_hint(value: dict) -> bool:
+    # Exactly {"kind": <known tag>, "value": ...}; a user dict that merely has a
+    # "kind" key (e.g. {"kind": "workshop", ...}) is hint data, not a tag
+    return value.keys() == {"kind", "value"} and value["kind"] in _HINT_KINDS
+
+
+def _tag_hint_data(value: Any) -> Any:
+    """Wrap untagged hint payloads (as the context agent sends them) with a kind."""
+    if isinstance(value, str):
+        return {"kind": "str", "value": value}
+    if isinstance(value, dict) and not _is_tagged_hint(value):
+        return {"kind": "dict", "value": value}
+    if isinstance(value, list):
+        if value and isinstance(value[0], dict):
+            return {"kind": "list_dict", "value": value}
+        return {"kind": "list_str", "value": value}
+    return value
+
+
 class ContextHint(BaseModel):
     """A single context hint with label and data"""
 
+    model_config = ConfigDict(defer_build=True)
+
     hint_label: str = Field(..., description="Human-readable label for this hint type")
-    hint_data: list[str] | list[dict[str, str]] | dict[str, str] | str = Field(
+    hint_data: HintData = Field(
         ..., description="The actual context data - can be list, dict, or string"
     )
     confidence: float = Field(
@@ -251,10 +310,17 @@ class ContextHint(BaseModel):
         description="Source of this hint (calendar, glossary, agent, etc.)",
     )
 
+    @field_validator("hint_data", mode="before")
+    @classmethod
+    def _tag_untagged(cls, value: Any) -> Any:
+        return _tag_hint_data(value)
+
 
 class ContextHints(BaseModel):
     """Collection of context hints from various sources"""
 
+    model_config = ConfigDict(defer_build=True)
+
     content_type: str = Field(..., description="Content type these hints apply to")
     hints: list[ContextHint] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(
@@ -263,6 +329,24 @@ class ContextHints(BaseModel):
     )
 
 
+class ExtraArgs(TypedDict, total=False):
+    """Optional per-run LLM overrides."""
+
+    temperature: float
+    max_tokens: int
+
+
+class FinalOutput(TypedDict, total=False):
+    """Response envelope produced by the return_response node."""
+
+    success: bool
+    content_type: str
+    structured_output: dict[str, Any] | None
+    output_file: str | None
+    messages: list[str]
+    errors: list[str]
+
+
 # Update BaseContentState to include context_hints
 class BaseContentState(TypedDict):
     """
@@ -279,7 +363,7 @@ class BaseContentState(TypedDict):
     llm_provider: str
     model: str
     verbose: bool
-    extra_args: dict[str, Any]
+    extra_args: ExtraArgs
     processing_mode: str  # <-- Add this line
 
     # Processing state
@@ -290,8 +374,8 @@ class BaseContentState(TypedDict):
     summary_model: (
         BaseModel | None
     )  # Will be populated with MeetingSummary, NewsSummary, etc.
-    structured_output: dict[str, Any]
-    final_output: dict[str, Any]
+    structured_output: dict[str, Any]  # Shape depends on the content type's model
+    final_output: FinalOutput
     context_hints: ContextHints | None  # New field
 
 
@@ -306,6 +390,8 @@ class ContentTypeDetection(BaseModel):
     Dynamically uses available content types from ALLOWED_CONTENT_MODELS registry.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     content_type: str = Field(
         ...,
         description="Detected content type. Must be one of the available content types or 'general'",
@@ -319,6 +405,16 @@ class ContentTypeDetection(BaseModel):
     reasoning: str = Field(
         ..., description="Brief explanation of why this content type was selected"
     )
+    runner_up_type: str | None = Field(
+        None,
+        description="Second most likely content type, or null if no other type is plausible",
+    )
+    runner_up_confidence: float | None = Field(
+        None,
+        ge=0.0,
+        le=1.0,
+        description="Confidence score between 0.0 and 1.0 for the runner-up type",
+    )
 
 
 # =============================================
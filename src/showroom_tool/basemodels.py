@@ -7,39 +7,69 @@ This module contains all Pydantic BaseModels used throughout the application
 for data validation and settings management.
 """
 
-from typing import Any, Literal
+import sys
+from collections.abc import Sequence
+from enum import StrEnum
+from functools import lru_cache
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import TypedDict  # pydantic rejects typing.TypedDict before 3.12
+
+# Shared by the models the LLM fills in: stray keys in a response are
+# dropped rather than stored, and results are never mutated once parsed
+LLM_OUTPUT_CONFIG = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+
+def _intern_all(values: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+
+# Product names repeat across nearly every lab, so keep one copy of each
+# string per process instead of one per parsed response
+ProductNames = Annotated[tuple[str, ...], AfterValidator(_intern_all)]
+
+
+class ContentType(StrEnum):
+    """Catalog item types; members compare and format as their plain string values."""
+
+    LAB = "lab"
+    DEMO = "demo"
 
 
 class ShowroomModule(BaseModel):
     """Pydantic BaseModel for individual lab modules within a Showroom."""
 
-    module_name: str = Field(
-        ...,
-        description="The name of the lab module extracted from its level 1 header ie `^= My module name`",
-    )
-    filename: str = Field(
-        ...,
-        description="The filename of the module from the navigation file (e.g., '01-intro.adoc')",
-    )
-    module_content: str = Field(
-        ..., description="The raw unprocessed asciidoc content of the module"
-    )
+    # Modules are never mutated after parsing, so they can be shared freely.
+    # defer_build: core schemas are built on first use rather than at import,
+    # so CLI paths that never touch a model don't pay for it
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    # Field docs live in comments: this model never reaches an LLM schema or
+    # prompt, so descriptions would only add schema metadata
+
+    # The module name from its level 1 header, ie `^= My module name`
+    module_name: str
+    # The module's filename from the navigation file (e.g., '01-intro.adoc')
+    filename: str
+    # The raw unprocessed asciidoc content of the module
+    module_content: str
 
 
 class ShowroomSummary(BaseModel):
     """Pydantic BaseModel for AI-generated Showroom lab summaries."""
 
-    redhat_products: list[str] = Field(
+    model_config = LLM_OUTPUT_CONFIG
+
+    redhat_products: ProductNames = Field(
         ...,
         description="The Red Hat products EXPLICITLY mentioned in the content"
     )
-    lab_audience: list[str] = Field(
+    lab_audience: tuple[str, ...] = Field(
         ...,
         description="The ideal audience for the content"
     )
-    lab_learning_objectives: list[str] = Field(
+    lab_learning_objectives: tuple[str, ...] = Field(
         ...,
         description="Identify the 4 to 6 learning objectives in the content"
     )
@@ -52,52 +82,24 @@ class ShowroomSummary(BaseModel):
 class ShowroomReview(BaseModel):
     """Pydantic BaseModel for AI-generated Showroom lab reviews."""
 
-    # completeness: float = Field(
-    #     ...,
-    #     ge=0,
-    #     le=10,
-    #     description="Score for completeness of content"
-    # )
+    model_config = LLM_OUTPUT_CONFIG
+
     completeness_feedback: str = Field(
         ...,
         description="Constructive feedback regarding completeness of content"
     )
-    # clarity: float = Field(
-    #     ...,
-    #     ge=0,
-    #     le=10,
-    #     description="Score for clarity of instructions"
-    # )
     clarity_feedback: str = Field(
         ...,
         description="Constructive feedback regarding clarity of content"
     )
-    # technical_detail: float = Field(
-    #     ...,
-    #     ge=0,
-    #     le=10,
-    #     description="Score for technical detail"
-    # )
     technical_detail_feedback: str = Field(
         ...,
         description="Constructive feedback regarding technical details of content"
     )
-    # usefulness: float = Field(
-    #     ...,
-    #     ge=0,
-    #     le=10,
-    #     description="Score for usefulness to target audience"
-    # )
     usefulness_feedback: str = Field(
         ...,
         description="Constructive feedback regarding usefulness of content"
     )
-    # business_value: float = Field(
-    #     ...,
-    #     ge=0,
-    #     le=10,
-    #     description="Score for business value of content"
-    # )
     business_value_feedback: str = Field(
         ...,
         description="Constructive feedback regarding business value of content"
@@ -113,64 +115,38 @@ class CatalogDescription(BaseModel):
     Pydantic BaseModel for AI-generated catalog descriptions of Showroom labs.
 
     Note:
-     The description fields are incorporated into the system prompt dynamically
-     so they can, and should, contain clear guidance for the AI to follow.
+     The detailed per-field guidance for the AI lives in
+     config.defaults.FIELD_GUIDANCE and is incorporated into the system prompt
+     dynamically; the descriptions here stay short since they are sent as part
+     of the response schema.
 
     """
 
+    model_config = LLM_OUTPUT_CONFIG
+
     headline: str = Field(
-        ...,
-        description="""
-        CONCISE and CLEAR summary of the catalog item, in 1-2 sentences.
-        First 115-120 characters are revealed on a thumbnail, so optimize for that.
-        YOUR GOAL is to make the headline as INFORMATIVE and ACCURATE as possible.
-        """
+        ..., description="Concise 1-2 sentence summary of the catalog item"
     )
-    content_type: Literal["lab", "demo"] = Field(
-        ...,
-        description="""
-        Type of catalog item determined by the content and narrative: 'lab' OR 'demo'. NO other content types are allowed.
-        A lab is a hands-on lab with a specific learning objective.
-        A demo is a demo of a product or feature, typically intended to show a product or feature in action.
-        A demo is typically a one to many experience where a technical seller shows a product or feature to a customer.
-        """,
-    )
-    products: list[str] = Field(
-        ...,
-        description="""
-        List of Red Hat Products covered in the lab.
-        Highlight the most important products in the lab.
-        If the lab is not about a product, mention the product that is most relevant to the lab.
-        Limit to 3-5 products.
-        OMIT products that are not relevant to the lab.
-        """
+    content_type: ContentType = Field(
+        ..., description="Type of catalog item: 'lab' or 'demo'"
     )
-    intended_audience_bullets: list[str] = Field(
-        ...,
-        description="""
-        2 to 4 audiences who would benefit from this type of content.
-        Typical audiences include:
-        - System Admins, often content focussed on Linux, RHEL, and possibly Ansible
-        - Cloud Admins, often content focussed on OpenShift, Kubernetes, and Public Cloud Providers such as AWS, Azure, and GCP
-        - DevOps Engineers, often content focussed on CI/CD, GitOps, and Observability, but can be more general
-        - Architects, often content focussed on the overall architecture of the solution
-        - Developers, often content focussed on coding and development of the solution versus infrastructure
-        - Data Scientists, often content focussed on data science, AI, ML, and DL
-        AVOID making up random new audiences types, use the above as a guide
-        DO HIGHLIGHT key points for each audience type if appropriate.
-        """
+    products: ProductNames = Field(
+        ..., description="The 3-5 most relevant Red Hat products covered"
     )
-    lab_bullets: list[str] = Field(
-        ...,
-        description="""
-        3 to 6 short 1 liners of the key takeaways of the lab
-        """
+    intended_audience_bullets: tuple[str, ...] = Field(
+        ..., description="2 to 4 audiences who would benefit from this content"
+    )
+    lab_bullets: tuple[str, ...] = Field(
+        ..., description="3 to 6 short 1 liners of the key takeaways of the lab"
     )
 
 
 class Showroom(BaseModel):
     """Pydantic BaseModel for lab and demo content from Showroom Git repositories."""
 
+    # Unknown keys are a caller bug, not data to carry along
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     lab_name: str = Field(
         ..., description="The name of the lab extracted from the Showroom Git Repo"
     )
@@ -178,7 +154,9 @@ class Showroom(BaseModel):
     git_ref: str = Field(
         default="main", description="The git tag or branch to use, defaults to main"
     )
-    modules: list[ShowroomModule] = Field(..., description="The Showroom Lab modules")
+    modules: tuple[ShowroomModule, ...] = Field(
+        ..., description="The Showroom Lab modules"
+    )
     summary_output: ShowroomSummary | None = Field(
         default=None, description="AI-generated summary of the lab content"
     )
@@ -189,39 +167,80 @@ class Showroom(BaseModel):
         default=None, description="AI-generated catalog description of the lab content"
     )
 
+    @classmethod
+    def from_trusted(
+        cls,
+        *,
+        lab_name: str,
+        git_url: str,
+        git_ref: str = "main",
+        modules: Sequence[ShowroomModule],
+    ) -> "Showroom":
+        """
+        Build a Showroom from data the tool parsed itself, skipping validation.
+
+        Only use this for content produced by the repository parser; anything
+        user-supplied should go through the regular constructor.
+        """
+        return cls.model_construct(
+            lab_name=lab_name, git_url=git_url, git_ref=git_ref, modules=tuple(modules)
+        )
+
+
+# The LLM-backed verbs; None on a state means fetch only
+CommandName = Literal["summary", "review", "description"]
+
+
+class FinalOutput(TypedDict, total=False):
+    """Result envelope the graph hands back to callers (see process_showroom_with_graph)."""
+
+    success: bool
+    error: str
+    command: CommandName
+    lab_name: str
+    git_url: str
+    git_ref: str
+    module_count: int
+    showroom_data: Showroom
+    structured_output: ShowroomSummary | ShowroomReview | CatalogDescription
+
 
 class ShowroomState(BaseModel):
     """LangGraph state for processing Showroom repositories."""
 
+    # Internal state only (never sent to an LLM), so fields are documented
+    # with comments rather than Field descriptions
+    model_config = ConfigDict(defer_build=True)
+
     # Repo fetch inputs
-    git_url: str = Field(..., description="The URL of the Showroom Git repository")
-    git_ref: str = Field(default="main", description="The git tag or branch to use")
-    verbose: bool = Field(default=False, description="Enable verbose output")
-    cache_dir: str | None = Field(default=None, description="Custom cache directory")
-    no_cache: bool = Field(default=False, description="Disable caching and force fresh clone")
-    local_dir: str | None = Field(
-        default=None,
-        description="Optional local directory path to an already-cloned Showroom repo (bypasses git clone/caching)",
-    )
+    git_url: str  # URL of the Showroom Git repository
+    git_ref: str = "main"  # Git tag or branch to use
+    verbose: bool = False
+    cache_dir: str | None = None  # Custom cache directory
+    no_cache: bool = False  # Disable caching and force a fresh clone
+    # Already-cloned local Showroom repo (bypasses git clone/caching)
+    local_dir: str | None = None
 
     # Processing verb and LLM options
-    command: Literal["summary", "review", "description"] | None = Field(
-        default=None,
-        description="Verb to process after fetching showroom data: 'summary' | 'review' | 'description'",
-    )
-    llm_provider: str | None = Field(
-        default=None, description="LLM provider identifier (e.g., openai, gemini, local)"
-    )
-    model: str | None = Field(default=None, description="LLM model name")
-    temperature: float | None = Field(
-        default=None, description="Temperature for LLM generation"
-    )
-    prompts_file: str | None = Field(
-        default=None, description="Optional path to prompts override file (.py or .json)"
-    )
+    command: CommandName | None = None
+    llm_provider: str | None = None  # e.g. openai, gemini, local
+    model: str | None = None
+    temperature: float | None = None
+    prompts_file: str | None = None  # Prompts override file (.py or .json)
 
     # Processing results
-    showroom: Showroom | None = Field(default=None, description="The processed Showroom data")
-    messages: list[str] = Field(default_factory=list, description="Processing messages")
-    errors: list[str] = Field(default_factory=list, description="Processing errors")
-    final_output: dict[str, Any] = Field(default_factory=dict, description="Final output data")
+    showroom: Showroom | None = None
+    messages: list[str] = Field(default_factory=list)
+    errors: list[str] = Field(default_factory=list)
+    final_output: FinalOutput = Field(default_factory=FinalOutput)
+
+
+@lru_cache(maxsize=1)
+def _modules_adapter() -> TypeAdapter[tuple[ShowroomModule, ...]]:
+    """Build the module-list TypeAdapter on first use so its core schema is only built once."""
+    return TypeAdapter(tuple[ShowroomModule, ...])
+
+
+def validate_modules(rows: Sequence[dict[str, Any]]) -> tuple[ShowroomModule, ...]:
+    """Validate raw module dicts in a single pydantic-core call instead of one per module."""
+    return _modules_adapter().validate_python(rows)
@@ -5,82 +5,73 @@ CLI entry point for showroom-tool that works properly when installed.
 """
 
 import argparse
-import asyncio
+import functools
+import os
 import sys
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from rich.console import Console
 
-# Try to import from the installed package structure
-try:
-    from showroom_tool import __version__
-    from showroom_tool.basemodels import (
-        CatalogDescription,
-        ShowroomReview,
-        ShowroomSummary,
-    )
-    from showroom_tool.outputs import (
-        check_jinja2_availability,
-        output_basemodel_as_adoc,
-    )
-    from showroom_tool.prompts import (
-        build_showroom_description_structured_prompt,
-        build_showroom_review_structured_prompt,
-        build_showroom_summary_structured_prompt,
-        load_prompts_overrides,
-    )
-    from showroom_tool.shared_utilities import (
-        print_basemodel,
-        save_description_to_workspace,
-        save_review_to_workspace,
-        save_summary_to_workspace,
-    )
-    from showroom_tool.showroom import count_words_and_lines
-except ImportError:
-    # Fall back to adding the project root to path (for development)
-    project_root = Path(__file__).parent.parent.parent
-    sys.path.insert(0, str(project_root / "src"))
-    from showroom_tool import __version__
-    from showroom_tool.basemodels import (
-        CatalogDescription,
-        ShowroomReview,
-        ShowroomSummary,
-    )
-    from showroom_tool.outputs import (
-        check_jinja2_availability,
-        output_basemodel_as_adoc,
-    )
-    from showroom_tool.prompts import (
-        build_showroom_description_structured_prompt,
-        build_showroom_review_structured_prompt,
-        build_showroom_summary_structured_prompt,
-        load_prompts_overrides,
-    )
-    from showroom_tool.shared_utilities import (
-        print_basemodel,
-        save_description_to_workspace,
-        save_review_to_workspace,
-        save_summary_to_workspace,
-    )
-    from showroom_tool.showroom import count_words_and_lines
+    from showroom_tool.basemodels import CommandName, FinalOutput
+
+# Optional faster event loop (pip install showroom-tool[uvloop]); checked without importing it
+UVLOOP_AVAILABLE = find_spec("uvloop") is not None
+
+# Package imports are deferred to the code that needs them so --help and
+# argument errors don't pay for pydantic models, prompts, Jinja2 or LangGraph
+_PATH_BOOTSTRAPPED = False
 
-console = Console()
+
+def _bootstrap_path() -> None:
+    """Make showroom_tool importable when running from a source checkout (once)."""
+    global _PATH_BOOTSTRAPPED
+    if _PATH_BOOTSTRAPPED:
+        return
+    _PATH_BOOTSTRAPPED = True
+    if find_spec("showroom_tool") is None:
+        # Fall back to adding the project root to path (for development)
+        project_root = Path(__file__).parent.parent.parent
+        sys.path.insert(0, str(project_root / "src"))
+
+
+@functools.cache
+def console() -> "Console":
+    """Shared Rich console, created on first use so JSON/AsciiDoc runs never probe the terminal."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _fast_escape(text: str) -> str:
+    """rich.markup.escape, skipping the regex for the common bracket-free text."""
+    # escape() only rewrites "[" tags and a trailing backslash
+    if "[" not in text and not text.endswith("\\"):
+        return text
+    from rich.markup import escape
+
+    return escape(text)
 
 
 def display_showroom_details(showroom, args):
     """Display detailed showroom information in verbose mode."""
-    console.print("\n[bold green]📚 Showroom Lab Details[/bold green]")
-    console.print("=" * 60)
+    from rich.console import Group
+    from rich.table import Table
 
-    # Lab metadata
-    console.print(f"[bold]Lab Name:[/bold] [bright_cyan]{showroom.lab_name}[/bright_cyan]")
-    console.print(f"[bold]Git Repository:[/bold] [blue]{showroom.git_url}[/blue]")
-    console.print(f"[bold]Git Reference:[/bold] [yellow]{showroom.git_ref}[/yellow]")
-    console.print(f"[bold]Total Modules:[/bold] [bright_magenta]{len(showroom.modules)}[/bright_magenta]")
+    from showroom_tool.showroom import count_words_and_lines
 
-    # Module details
-    console.print("\n[bold green]📖 Module Breakdown[/bold green]")
-    console.print("-" * 60)
+    # Module details, one row per module
+    table = Table(show_header=True, header_style="bold green", box=None, padding=(0, 1))
+    table.add_column("#", style="bright_white", justify="right")
+    table.add_column("Module", style="bold")
+    table.add_column("File", style="cyan")
+    table.add_column("Words", style="green", justify="right")
+    table.add_column("Lines", style="blue", justify="right")
 
     total_words = 0
     total_lines = 0
@@ -89,42 +80,57 @@ def display_showroom_details(showroom, args):
         # Get module display name
         display_name = module.module_name.strip() if module.module_name.strip() else "(no title)"
 
-        # Escape special characters to avoid Rich formatting conflicts
-        from rich.markup import escape
-        safe_display_name = escape(display_name)
-
         # Count words and lines
         word_count, line_count = count_words_and_lines(module.module_content)
         total_words += word_count
         total_lines += line_count
 
-        # Display module info with rich formatting
-        console.print(
-            f"  [bright_white]{i:2d}.[/bright_white] "
-            f"[bold]{safe_display_name}[/bold]"
-        )
-        console.print(
-            f"      [dim]File:[/dim] [cyan]{module.filename}[/cyan] "
-            f"[dim]|[/dim] [green]{word_count:,} words[/green] "
-            f"[dim]|[/dim] [blue]{line_count:,} lines[/blue]"
+        # Escape special characters to avoid Rich formatting conflicts
+        table.add_row(str(i), _fast_escape(display_name), _fast_escape(module.filename), f"{word_count:,}", f"{line_count:,}")
+
+    # Render everything in one print so Rich lays it out in a single pass
+    console().print(
+        Group(
+            "\n[bold green]📚 Showroom Lab Details[/bold green]",
+            "=" * 60,
+            # Lab metadata
+            f"[bold]Lab Name:[/bold] [bright_cyan]{_fast_escape(showroom.lab_name)}[/bright_cyan]",
+            f"[bold]Git Repository:[/bold] [blue]{_fast_escape(showroom.git_url)}[/blue]",
+            f"[bold]Git Reference:[/bold] [yellow]{_fast_escape(showroom.git_ref)}[/yellow]",
+            f"[bold]Total Modules:[/bold] [bright_magenta]{len(showroom.modules)}[/bright_magenta]",
+            "\n[bold green]📖 Module Breakdown[/bold green]",
+            "-" * 60,
+            table,
+            "-" * 60,
+            # Summary totals
+            f"[bold]📊 Totals:[/bold] "
+            f"[green]{total_words:,} words[/green] "
+            f"[dim]|[/dim] [blue]{total_lines:,} lines[/blue] "
+            f"[dim]across[/dim] [bright_magenta]{len(showroom.modules)} modules[/bright_magenta]",
+            "=" * 60,
         )
-
-    # Summary totals
-    console.print("-" * 60)
-    console.print(
-        f"[bold]📊 Totals:[/bold] "
-        f"[green]{total_words:,} words[/green] "
-        f"[dim]|[/dim] [blue]{total_lines:,} lines[/blue] "
-        f"[dim]across[/dim] [bright_magenta]{len(showroom.modules)} modules[/bright_magenta]"
     )
-    console.print("=" * 60)
 
 
-def parse_arguments() -> argparse.Namespace:
+_SUBCOMMANDS = {
+    # Summary command - fetch + LLM summarization
+    "summary": "Generate AI-powered summary of showroom content",
+    # Review command - fetch + LLM review
+    "review": "Generate AI-powered review of showroom content",
+    # Description command - fetch + LLM catalog description
+    "description": "Generate AI-powered catalog description of showroom content",
+    # All three from a single fetch, with the LLM calls run concurrently
+    "all": "Generate summary, review and catalog description in one run",
+}
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse command line arguments for showroom-tool."""
+    if argv is None:
+        argv = sys.argv[1:]
     parser = argparse.ArgumentParser(
         description="Showroom Tool - CLI for summarizing, reviewing, and validating technical lab content",
-        epilog="Examples:\n  showroom-tool summary https://github.com/example/my-lab\n  showroom-tool review https://github.com/example/my-lab\n  showroom-tool description https://github.com/example/my-lab",
+        epilog="Examples:\n  showroom-tool summary https://github.com/example/my-lab\n  showroom-tool review https://github.com/example/my-lab\n  showroom-tool description https://github.com/example/my-lab\n  showroom-tool all https://github.com/example/my-lab --output json",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -139,428 +145,390 @@ def parse_arguments() -> argparse.Namespace:
     # Add subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Summary command - fetch + LLM summarization
-    summary_parser = subparsers.add_parser("summary", help="Generate AI-powered summary of showroom content")
-    add_common_arguments(summary_parser)
-    add_llm_arguments(summary_parser)
-
-    # Review command - fetch + LLM review
-    review_parser = subparsers.add_parser("review", help="Generate AI-powered review of showroom content")
-    add_common_arguments(review_parser)
-    add_llm_arguments(review_parser)
-
-    # Description command - fetch + LLM catalog description
-    description_parser = subparsers.add_parser("description", help="Generate AI-powered catalog description of showroom content")
-    add_common_arguments(description_parser)
-    add_llm_arguments(description_parser)
-
-    return parser.parse_args()
+    # Only the requested subcommand needs its arguments; help and unknown
+    # commands still get the full listing
+    chosen = _sniff_subcommand(argv)
+    for name, help_text in _SUBCOMMANDS.items():
+        if chosen is not None and name != chosen:
+            continue
+        subparser = subparsers.add_parser(name, help=help_text)
+        add_common_arguments(subparser)
+        add_llm_arguments(subparser)
+
+    return parser.parse_args(argv)
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None when all parsers are needed."""
+    if any(arg in ("-h", "--help") for arg in argv):
+        return None
+    for arg in argv:
+        if arg in _SUBCOMMANDS:
+            return arg
+    return None
+
+
+OUTPUT_FORMATS = ("verbose", "json", "adoc")
+LLM_PROVIDERS = ("openai", "gemini", "local")
+
+# (flags, add_argument kwargs) pairs
+_Options = tuple[tuple[tuple[str, ...], dict[str, Any]], ...]
+
+# Options shared by every subparser; built once at import
+_COMMON_OPTS: _Options = (
+    (("repo_url",), {"nargs": "?", "help": "Git repository URL containing the showroom lab"}),
+    (
+        ("--git-repo",),
+        {"help": "Git repository URL containing the showroom lab (alternative to positional argument)"},
+    ),
+    (
+        ("--git-ref",),
+        {"default": "main", "help": "Git reference (branch, tag, or commit) to use (default: main)"},
+    ),
+    (("--verbose", "-v"), {"action": "store_true", "help": "Enable verbose output"}),
+    (("--no-cache",), {"action": "store_true", "help": "Disable caching and force fresh clone"}),
+    (
+        ("--cache-dir",),
+        {"default": None, "help": "Custom cache directory (default: ~/.showroom-tool/cache)"},
+    ),
+    (
+        ("--dir",),
+        {
+            "dest": "local_dir",
+            "default": None,
+            "help": "Path to a local Showroom repo directory (bypass git clone/cache)",
+        },
+    ),
+    (
+        ("--output",),
+        {
+            "default": "verbose",
+            "choices": OUTPUT_FORMATS,
+            "help": "Output format: 'verbose' for rich console output (default), 'json' for clean JSON output, 'adoc' for AsciiDoc output",
+        },
+    ),
+    (
+        ("--prompts-file",),
+        {
+            "dest": "prompts_file",
+            "default": None,
+            "help": "Path to a prompts override file (.py or .json) to override defaults in prompts.py",
+        },
+    ),
+)
+
+_LLM_OPTS: _Options = (
+    (
+        ("--llm-provider",),
+        {"default": None, "choices": LLM_PROVIDERS, "help": "LLM provider to use (default: gemini)"},
+    ),
+    (("--model",), {"default": None, "help": "Model name to use (provider-specific)"}),
+    (
+        ("--temperature",),
+        {"type": float, "default": None, "help": "Temperature for LLM generation (default: 0.1)"},
+    ),
+    (
+        ("--output-prompt",),
+        {"action": "store_true", "help": "Display the AI prompt template instead of processing content"},
+    ),
+)
+
+
+def _add_options(parser: argparse.ArgumentParser, options: _Options) -> None:
+    for flags, kwargs in options:
+        parser.add_argument(*flags, **kwargs)
 
 
 def add_common_arguments(parser):
     """Add common arguments to a parser."""
-    parser.add_argument(
-        "repo_url", nargs="?", help="Git repository URL containing the showroom lab"
-    )
-    parser.add_argument(
-        "--git-repo",
-        help="Git repository URL containing the showroom lab (alternative to positional argument)",
-    )
-    parser.add_argument(
-        "--git-ref",
-        default="main",
-        help="Git reference (branch, tag, or commit) to use (default: main)",
-    )
-    parser.add_argument(
-        "--verbose", "-v", action="store_true", help="Enable verbose output"
-    )
-    parser.add_argument(
-        "--no-cache", action="store_true", help="Disable caching and force fresh clone"
-    )
-    parser.add_argument(
-        "--cache-dir",
-        default=None,
-        help="Custom cache directory (default: ~/.showroom-tool/cache)",
-    )
-    parser.add_argument(
-        "--dir",
-        dest="local_dir",
-        default=None,
-        help="Path to a local Showroom repo directory (bypass git clone/cache)",
-    )
-    parser.add_argument(
-        "--output",
-        default="verbose",
-        choices=["verbose", "json", "adoc"],
-        help="Output format: 'verbose' for rich console output (default), 'json' for clean JSON output, 'adoc' for AsciiDoc output",
-    )
-    parser.add_argument(
-        "--prompts-file",
-        dest="prompts_file",
-        default=None,
-        help="Path to a prompts override file (.py or .json) to override defaults in prompts.py",
-    )
+    _add_options(parser, _COMMON_OPTS)
 
 
 def add_llm_arguments(parser):
     """Add LLM-specific arguments to a parser."""
-    parser.add_argument(
-        "--llm-provider",
-        default=None,
-        choices=["openai", "gemini", "local"],
-        help="LLM provider to use (default: gemini)",
-    )
-    parser.add_argument(
-        "--model",
-        default=None,
-        help="Model name to use (provider-specific)",
-    )
-    parser.add_argument(
-        "--temperature",
-        type=float,
-        default=None,
-        help="Temperature for LLM generation (default: 0.1)",
-    )
-    parser.add_argument(
-        "--output-prompt",
-        action="store_true",
-        help="Display the AI prompt template instead of processing content",
-    )
+    _add_options(parser, _LLM_OPTS)
 
 
+class CommandImpl(NamedTuple):
+    """The model and helpers a command uses, imported by its loader on first use."""
 
-async def handle_summary_command(args):
-    """Handle the summary command to generate AI-powered summary."""
-    # Auto-discover project/user prompt overrides (Requirement 11.11)
-    try:
-        from showroom_tool import prompt_builder as _pb  # type: ignore
-        from showroom_tool import prompts as _pr
-        _discovered = _pb.get_prompts_and_settings()
-        for _k, _v in _discovered.items():
-            _pr.PROMPTS_FILE_OVERRIDES.setdefault(_k, _v)
-    except Exception:
-        pass
-    # Check if user wants to see the prompt template
-    if args.output_prompt:
-        console.print("\n[bold blue]AI Summary Prompt Template[/bold blue]")
-        console.print("[blue]Displaying standard Showroom lab summary analysis prompt...[/blue]")
+    model: "type[BaseModel]"
+    build_prompt: "Callable[[type[BaseModel]], str]"
+    save: "Callable[[BaseModel], str]"
 
-        try:
-            # Requirement 11.9: Load prompts overrides early when showing prompt
-            if args.prompts_file:
-                load_prompts_overrides(args.prompts_file)
-
-            # Build the standard prompt without requiring actual showroom data
-            system_prompt = build_showroom_summary_structured_prompt(ShowroomSummary)
-            console.print("\n[bold green]Summary Analysis Prompt:[/bold green]")
-            console.print(f"[dim]Length: {len(system_prompt)} characters[/dim]\n")
-            console.print(system_prompt)
-            return
-        except Exception as e:
-            console.print(f"[red]Error building prompt: {e}[/red]")
-            sys.exit(1)
 
-    # Determine output mode
-    is_json_output = args.output == "json"
-    is_clean_output = args.output in ["json", "adoc"]  # Both modes need clean output
+def _load_summary() -> CommandImpl:
+    from showroom_tool.basemodels import ShowroomSummary
+    from showroom_tool.prompts import build_showroom_summary_structured_prompt
+    from showroom_tool.shared_utilities import save_summary_to_workspace
 
-    if not is_clean_output:
-        console.print("\n[bold blue]AI Summary Generation[/bold blue]")
+    return CommandImpl(ShowroomSummary, build_showroom_summary_structured_prompt, save_summary_to_workspace)
 
-    # Get repository data first
-    showroom = await fetch_showroom_data(args)
 
-    # Display detailed showroom information in verbose mode
-    if not is_clean_output and args.output == "verbose":
-        display_showroom_details(showroom, args)
+def _load_review() -> CommandImpl:
+    from showroom_tool.basemodels import ShowroomReview
+    from showroom_tool.prompts import build_showroom_review_structured_prompt
+    from showroom_tool.shared_utilities import save_review_to_workspace
 
-    # Generate AI summary
-    if not is_clean_output:
-        console.print("\n[blue]Generating AI summary...[/blue]")
+    return CommandImpl(ShowroomReview, build_showroom_review_structured_prompt, save_review_to_workspace)
 
-    try:
-        from showroom_tool.graph_factory import process_showroom_with_graph
 
-        result = await process_showroom_with_graph(
-            git_url=showroom.git_url,
-            git_ref=showroom.git_ref,
-            verbose=args.verbose and not is_clean_output,
-            cache_dir=args.cache_dir,
-            no_cache=args.no_cache,
-            local_dir=args.local_dir,
-            command="summary",
-            llm_provider=args.llm_provider,
-            model=args.model,
-            temperature=args.temperature,
-            prompts_file=args.prompts_file,
-        )
+def _load_description() -> CommandImpl:
+    from showroom_tool.basemodels import CatalogDescription
+    from showroom_tool.prompts import build_showroom_description_structured_prompt
+    from showroom_tool.shared_utilities import save_description_to_workspace
 
-        if result.get("success"):
-            structured = result.get("structured_output")
-            if is_json_output:
-                import json
-                print(json.dumps(structured, indent=2, ensure_ascii=False))
-            elif args.output == "adoc":
-                if not check_jinja2_availability():
-                    print("Error: Jinja2 is required for AsciiDoc output. Install it with 'pip install jinja2'", file=sys.stderr)
-                    sys.exit(1)
-                extra_context = {
-                    "lab_name": result.get("lab_name"),
-                    "git_url": result.get("git_url"),
-                    "git_ref": result.get("git_ref"),
-                }
-                summary = ShowroomSummary(**(structured or {}))
-                output_basemodel_as_adoc(summary, extra_context)
-            else:
-                console.print("\n[bold green]✅ AI Summary Generated Successfully![/bold green]")
-                summary = ShowroomSummary(**(structured or {}))
-                print_basemodel(summary, "Showroom Summary")
-                saved_path = save_summary_to_workspace(summary)
-                console.print(f"\n[blue]💾 Summary saved to: {saved_path}[/blue]")
-        else:
-            err = result.get("error", "Failed to generate summary")
-            if is_clean_output:
-                print(f"Error: {err}", file=sys.stderr)
-            else:
-                console.print(f"\n[red]❌ {err}[/red]")
-            sys.exit(1)
+    return CommandImpl(
+        CatalogDescription, build_showroom_description_structured_prompt, save_description_to_workspace
+    )
 
-    except Exception as e:
-        if is_clean_output:
-            # For clean output modes, print error to stderr and exit
-            print(f"Error: {str(e)}", file=sys.stderr)
-            if args.verbose:
-                import traceback
-                print(traceback.format_exc(), file=sys.stderr)
-            sys.exit(1)
-        else:
-            console.print(f"[red]Error during AI processing: {e}[/red]")
-            if args.verbose:
-                import traceback
-                console.print(f"[red]{traceback.format_exc()}[/red]")
-            sys.exit(1)
 
+@dataclass(frozen=True)
+class CommandSpec:
+    """Per-command settings for the shared handler; load() does the heavy imports."""
+
+    name: "CommandName"
+    label: str
+    title: str
+    load: Callable[[], CommandImpl]
+    progress: str
+
+
+_COMMAND_TABLE = {
+    "summary": CommandSpec(
+        name="summary",
+        label="Summary",
+        title="Showroom Summary",
+        load=_load_summary,
+        progress="summary",
+    ),
+    "review": CommandSpec(
+        name="review",
+        label="Review",
+        title="Showroom Review",
+        load=_load_review,
+        progress="review",
+    ),
+    "description": CommandSpec(
+        name="description",
+        label="Description",
+        title="Catalog Description",
+        load=_load_description,
+        progress="catalog description",
+    ),
+}
+
+
+def _emit_json(generated: "list[tuple[CommandSpec, FinalOutput]]", keyed: bool) -> None:
+    """Write the structured output(s) as JSON; several commands are keyed by name."""
+    from pydantic_core import to_json
+
+    payload: object
+    if keyed:
+        payload = {spec.name: result.get("structured_output") for spec, result in generated}
+    else:
+        payload = generated[0][1].get("structured_output")
+    # UTF-8 bytes straight from pydantic-core; skips the text layer
+    sys.stdout.flush()
+    sys.stdout.buffer.write(to_json(payload, indent=2) + b"\n")
+    sys.stdout.flush()
+
+
+def _emit_adoc(generated: "list[tuple[CommandSpec, FinalOutput]]", keyed: bool) -> None:
+    """Render each structured output through its AsciiDoc template."""
+    # Jinja2 availability is checked up front by _validate_args
+    from showroom_tool.outputs import output_basemodel_as_adoc
+
+    for _, result in generated:
+        extra_context = {
+            "lab_name": result.get("lab_name"),
+            "git_url": result.get("git_url"),
+            "git_ref": result.get("git_ref"),
+        }
+        output_basemodel_as_adoc(cast("BaseModel", result.get("structured_output")), extra_context)
+
+
+def _emit_verbose(generated: "list[tuple[CommandSpec, FinalOutput]]", keyed: bool) -> None:
+    """Print each structured output to the console and save it to the workspace."""
+    from showroom_tool import shared_utilities
+
+    for spec, result in generated:
+        console().print(f"\n[bold green]✅ AI {spec.label} Generated Successfully![/bold green]")
+        structured = cast("BaseModel", result.get("structured_output"))
+        shared_utilities.print_basemodel(structured, spec.title)
+        saved_path = spec.load().save(structured)
+        console().print(f"\n[blue]💾 {spec.label} saved to: {saved_path}[/blue]")
+
+
+def _validate_args(args: argparse.Namespace) -> None:
+    """Exit early on arguments that would only fail after the repository fetch."""
+    if not (args.repo_url or args.git_repo or args.local_dir):
+        if args.output == "json":
+            print("Error: Repository URL or --dir PATH is required", file=sys.stderr)
+        else:
+            console().print("[red]Error: Repository URL or --dir PATH is required[/red]")
+            console().print("Usage: showroom-tool <command> <repo_url> \\[options] or showroom-tool <command> --dir <PATH>")
+        sys.exit(1)
 
-async def handle_review_command(args):
-    """Handle the review command to generate AI-powered review."""
-    # Auto-discover project/user prompt overrides (Requirement 11.11)
-    try:
-        from showroom_tool import prompt_builder as _pb  # type: ignore
-        from showroom_tool import prompts as _pr
-        _discovered = _pb.get_prompts_and_settings()
-        for _k, _v in _discovered.items():
-            _pr.PROMPTS_FILE_OVERRIDES.setdefault(_k, _v)
-    except Exception:
-        pass
-    # Check if user wants to see the prompt template
-    if args.output_prompt:
-        console.print("\n[bold blue]AI Review Prompt Template[/bold blue]")
-        console.print("[blue]Displaying standard Showroom lab review analysis prompt...[/blue]")
+    if args.output == "adoc":
+        from showroom_tool.outputs import check_jinja2_availability
 
-        try:
-            if args.prompts_file:
-                load_prompts_overrides(args.prompts_file)
-
-            # Build the standard prompt without requiring actual showroom data
-            system_prompt = build_showroom_review_structured_prompt(ShowroomReview)
-            console.print("\n[bold green]Review Analysis Prompt:[/bold green]")
-            console.print(f"[dim]Length: {len(system_prompt)} characters[/dim]\n")
-            console.print(system_prompt)
-            return
-        except Exception as e:
-            console.print(f"[red]Error building prompt: {e}[/red]")
+        if not check_jinja2_availability():
+            print("Error: Jinja2 is required for AsciiDoc output. Install it with 'pip install jinja2'", file=sys.stderr)
             sys.exit(1)
 
-    # Determine output mode
-    is_json_output = args.output == "json"
-    is_clean_output = args.output in ["json", "adoc"]  # Both modes need clean output
-
-    if not is_clean_output:
-        console.print("\n[bold blue]AI Review Generation[/bold blue]")
 
-    # Get repository data first
-    showroom = await fetch_showroom_data(args)
+# --output value -> emitter, resolved once per command
+_OUTPUT_DISPATCH = {
+    "json": _emit_json,
+    "adoc": _emit_adoc,
+    "verbose": _emit_verbose,
+}
 
-    # Display detailed showroom information in verbose mode
-    if not is_clean_output and args.output == "verbose":
-        display_showroom_details(showroom, args)
 
-    # Generate AI review
-    if not is_clean_output:
-        console.print("\n[blue]Generating AI review...[/blue]")
+_Handler = Callable[..., Coroutine[Any, Any, None]]
 
-    try:
-        from showroom_tool.graph_factory import process_showroom_with_graph
 
-        result = await process_showroom_with_graph(
-            git_url=showroom.git_url,
-            git_ref=showroom.git_ref,
-            verbose=args.verbose and not is_clean_output,
-            cache_dir=args.cache_dir,
-            no_cache=args.no_cache,
-            local_dir=args.local_dir,
-            command="review",
-            llm_provider=args.llm_provider,
-            model=args.model,
-            temperature=args.temperature,
-            prompts_file=args.prompts_file,
-        )
+def _cli_error_boundary(handler: _Handler) -> _Handler:
+    """Report unexpected handler errors on stderr (clean output) or the console, then exit 1."""
 
-        if result.get("success"):
-            structured = result.get("structured_output")
-            if is_json_output:
-                import json
-                print(json.dumps(structured, indent=2, ensure_ascii=False))
-            elif args.output == "adoc":
-                if not check_jinja2_availability():
-                    print("Error: Jinja2 is required for AsciiDoc output. Install it with 'pip install jinja2'", file=sys.stderr)
-                    sys.exit(1)
-                extra_context = {
-                    "lab_name": result.get("lab_name"),
-                    "git_url": result.get("git_url"),
-                    "git_ref": result.get("git_ref"),
-                }
-                review = ShowroomReview(**(structured or {}))
-                output_basemodel_as_adoc(review, extra_context)
-            else:
-                console.print("\n[bold green]✅ AI Review Generated Successfully![/bold green]")
-                review = ShowroomReview(**(structured or {}))
-                print_basemodel(review, "Showroom Review")
-                saved_path = save_review_to_workspace(review)
-                console.print(f"\n[blue]💾 Review saved to: {saved_path}[/blue]")
-        else:
-            err = result.get("error", "Failed to generate review")
-            if is_clean_output:
-                print(f"Error: {err}", file=sys.stderr)
+    @functools.wraps(handler)
+    async def wrapper(args: argparse.Namespace, *specs: CommandSpec) -> None:
+        try:
+            await handler(args, *specs)
+        except Exception as e:
+            import traceback
+
+            if args.output in ["json", "adoc"]:
+                # For clean output modes, write straight to the stderr file descriptor
+                message = f"Error: {e}\n"
+                if args.verbose:
+                    message += traceback.format_exc()
+                sys.stderr.flush()
+                os.write(2, message.encode(errors="replace"))
             else:
-                console.print(f"\n[red]❌ {err}[/red]")
+                console().print(f"[red]Error during AI processing: {e}[/red]")
+                if args.verbose:
+                    console().print(f"[red]{traceback.format_exc()}[/red]")
             sys.exit(1)
 
-    except Exception as e:
-        if is_clean_output:
-            # For clean output modes, print error to stderr and exit
-            print(f"Error: {str(e)}", file=sys.stderr)
-            if args.verbose:
-                import traceback
-                print(traceback.format_exc(), file=sys.stderr)
-            sys.exit(1)
-        else:
-            console.print(f"[red]Error during AI processing: {e}[/red]")
-            if args.verbose:
-                import traceback
-                console.print(f"[red]{traceback.format_exc()}[/red]")
-            sys.exit(1)
+    return wrapper
+
 
+@_cli_error_boundary
+async def handle_command(args: argparse.Namespace, *specs: CommandSpec) -> None:
+    """Handle one or more summary/review/description commands described by specs.
+
+    The repository is fetched and parsed once and every requested output is
+    generated from it concurrently.
+    """
+    import asyncio
+
+    _bootstrap_path()
+    from showroom_tool import prompts
 
-async def handle_description_command(args):
-    """Handle the description command to generate AI-powered catalog description."""
     # Auto-discover project/user prompt overrides (Requirement 11.11)
     try:
         from showroom_tool import prompt_builder as _pb  # type: ignore
-        from showroom_tool import prompts as _pr
         _discovered = _pb.get_prompts_and_settings()
         for _k, _v in _discovered.items():
-            _pr.PROMPTS_FILE_OVERRIDES.setdefault(_k, _v)
+            prompts.PROMPTS_FILE_OVERRIDES.setdefault(_k, _v)
     except Exception:
         pass
     # Check if user wants to see the prompt template
     if args.output_prompt:
-        console.print("\n[bold blue]AI Description Prompt Template[/bold blue]")
-        console.print("[blue]Displaying standard Showroom lab description analysis prompt...[/blue]")
+        for spec in specs:
+            console().print(f"\n[bold blue]AI {spec.label} Prompt Template[/bold blue]")
+            console().print(f"[blue]Displaying standard Showroom lab {spec.name} analysis prompt...[/blue]")
+
+            try:
+                # Requirement 11.9: Load prompts overrides early when showing prompt
+                if args.prompts_file:
+                    prompts.load_prompts_overrides(args.prompts_file)
+
+                # Build the standard prompt without requiring actual showroom data
+                impl = spec.load()
+                system_prompt = impl.build_prompt(impl.model)
+                console().print(f"\n[bold green]{spec.label} Analysis Prompt:[/bold green]")
+                console().print(f"[dim]Length: {len(system_prompt)} characters[/dim]\n")
+                console().print(system_prompt)
+            except Exception as e:
+                console().print(f"[red]Error building prompt: {e}[/red]")
+                sys.exit(1)
+        return
 
-        try:
-            if args.prompts_file:
-                load_prompts_overrides(args.prompts_file)
-
-            # Build the standard prompt without requiring actual showroom data
-            system_prompt = build_showroom_description_structured_prompt(CatalogDescription)
-            console.print("\n[bold green]Description Analysis Prompt:[/bold green]")
-            console.print(f"[dim]Length: {len(system_prompt)} characters[/dim]\n")
-            console.print(system_prompt)
-            return
-        except Exception as e:
-            console.print(f"[red]Error building prompt: {e}[/red]")
-            sys.exit(1)
+    # Fail before any banner, repository fetch or LangGraph import
+    _validate_args(args)
 
     # Determine output mode
-    is_json_output = args.output == "json"
     is_clean_output = args.output in ["json", "adoc"]  # Both modes need clean output
+    emit = _OUTPUT_DISPATCH[args.output]
 
     if not is_clean_output:
-        console.print("\n[bold blue]AI Description Generation[/bold blue]")
+        label = " / ".join(spec.label for spec in specs)
+        console().print(f"\n[bold blue]AI {label} Generation[/bold blue]")
 
     # Get repository data first
     showroom = await fetch_showroom_data(args)
 
+    from showroom_tool.graph_factory import process_showroom_with_graph
+
+    # gather() schedules every run now; they only progress once the loop is free
+    graph_runs = asyncio.gather(
+        *(
+            process_showroom_with_graph(
+                git_url=showroom.git_url,
+                git_ref=showroom.git_ref,
+                verbose=args.verbose and not is_clean_output,
+                cache_dir=args.cache_dir,
+                no_cache=args.no_cache,
+                local_dir=args.local_dir,
+                command=spec.name,
+                llm_provider=args.llm_provider,
+                model=args.model,
+                temperature=args.temperature,
+                prompts_file=args.prompts_file,
+                # Reuse the parsed repo instead of fetching it again
+                showroom=showroom,
+            )
+            for spec in specs
+        )
+    )
+
     # Display detailed showroom information in verbose mode
     if not is_clean_output and args.output == "verbose":
-        display_showroom_details(showroom, args)
+        if args.verbose:
+            # The graph prints its own progress; keep the two from interleaving
+            display_showroom_details(showroom, args)
+        else:
+            # Render the details on a worker thread while the LLM requests are in flight
+            await asyncio.to_thread(display_showroom_details, showroom, args)
 
-    # Generate AI description
+    # Generate AI output
     if not is_clean_output:
-        console.print("\n[blue]Generating AI catalog description...[/blue]")
+        progress = ", ".join(spec.progress for spec in specs)
+        console().print(f"\n[blue]Generating AI {progress}...[/blue]")
 
-    try:
-        from showroom_tool.graph_factory import process_showroom_with_graph
-
-        result = await process_showroom_with_graph(
-            git_url=showroom.git_url,
-            git_ref=showroom.git_ref,
-            verbose=args.verbose and not is_clean_output,
-            cache_dir=args.cache_dir,
-            no_cache=args.no_cache,
-            local_dir=args.local_dir,
-            command="description",
-            llm_provider=args.llm_provider,
-            model=args.model,
-            temperature=args.temperature,
-            prompts_file=args.prompts_file,
-        )
+    results = await graph_runs
 
+    failed = False
+    generated = []
+    for spec, result in zip(specs, results, strict=True):
         if result.get("success"):
-            structured = result.get("structured_output")
-            if is_json_output:
-                import json
-                print(json.dumps(structured, indent=2, ensure_ascii=False))
-            elif args.output == "adoc":
-                if not check_jinja2_availability():
-                    print("Error: Jinja2 is required for AsciiDoc output. Install it with 'pip install jinja2'", file=sys.stderr)
-                    sys.exit(1)
-                extra_context = {
-                    "lab_name": result.get("lab_name"),
-                    "git_url": result.get("git_url"),
-                    "git_ref": result.get("git_ref"),
-                }
-                description = CatalogDescription(**(structured or {}))
-                output_basemodel_as_adoc(description, extra_context)
-            else:
-                console.print("\n[bold green]✅ AI Description Generated Successfully![/bold green]")
-                description = CatalogDescription(**(structured or {}))
-                print_basemodel(description, "Catalog Description")
-                saved_path = save_description_to_workspace(description)
-                console.print(f"\n[blue]💾 Description saved to: {saved_path}[/blue]")
-        else:
-            err = result.get("error", "Failed to generate description")
-            if is_clean_output:
-                print(f"Error: {err}", file=sys.stderr)
-            else:
-                console.print(f"\n[red]❌ {err}[/red]")
-            sys.exit(1)
-
-    except Exception as e:
+            generated.append((spec, result))
+            continue
+        failed = True
+        err = result.get("error", f"Failed to generate {spec.name}")
         if is_clean_output:
-            # For clean output modes, print error to stderr and exit
-            print(f"Error: {str(e)}", file=sys.stderr)
-            if args.verbose:
-                import traceback
-                print(traceback.format_exc(), file=sys.stderr)
-            sys.exit(1)
+            print(f"Error: {err}", file=sys.stderr)
         else:
-            console.print(f"[red]Error during AI processing: {e}[/red]")
-            if args.verbose:
-                import traceback
-                console.print(f"[red]{traceback.format_exc()}[/red]")
-            sys.exit(1)
+            console().print(f"\n[red]❌ {err}[/red]")
+
+    if generated:
+        emit(generated, len(specs) > 1)
+
+    if failed:
+        sys.exit(1)
 
 
 async def fetch_showroom_data(args):
@@ -568,24 +536,16 @@ async def fetch_showroom_data(args):
     # Determine output mode
     is_json_output = getattr(args, 'output', 'verbose') == "json"
 
-    # Determine the repository URL (from positional arg or --git-repo flag)
+    # Determine the repository URL (from positional arg or --git-repo flag);
+    # _validate_args has already ensured this or --dir is set
     repo_url = args.repo_url or args.git_repo
 
-    if not repo_url and not args.local_dir:
-        if is_json_output:
-            print("Error: Repository URL or --dir PATH is required", file=sys.stderr)
-            sys.exit(1)
-        else:
-            console.print("[red]Error: Repository URL or --dir PATH is required[/red]")
-            console.print("Usage: showroom-tool <command> <repo_url> [options] or showroom-tool <command> --dir <PATH>")
-        sys.exit(1)
-
     if args.verbose and not is_json_output:
         if args.local_dir:
-            console.print(f"[blue]Using local directory: {args.local_dir}[/blue]")
+            console().print(f"[blue]Using local directory: {args.local_dir}[/blue]")
         if repo_url:
-            console.print(f"[blue]Processing repository: {repo_url}[/blue]")
-        console.print("[blue]Using LangGraph processing...[/blue]")
+            console().print(f"[blue]Processing repository: {repo_url}[/blue]")
+        console().print("[blue]Using LangGraph processing...[/blue]")
 
     # Import the LangGraph function
     from showroom_tool.graph_factory import process_showroom_with_graph
@@ -607,7 +567,7 @@ async def fetch_showroom_data(args):
             if is_json_output:
                 print(error_msg, file=sys.stderr)
             else:
-                console.print(f"[red]{error_msg}[/red]")
+                console().print(f"[red]{error_msg}[/red]")
             sys.exit(1)
 
         showroom = result.get("showroom_data")
@@ -616,7 +576,7 @@ async def fetch_showroom_data(args):
             if is_json_output:
                 print(error_msg, file=sys.stderr)
             else:
-                console.print(f"[red]{error_msg}[/red]")
+                console().print(f"[red]{error_msg}[/red]")
             sys.exit(1)
 
         return showroom
@@ -626,45 +586,59 @@ async def fetch_showroom_data(args):
         if is_json_output:
             print(error_msg, file=sys.stderr)
         else:
-            console.print(f"[red]{error_msg}[/red]")
+            console().print(f"[red]{error_msg}[/red]")
         sys.exit(1)
 
 
 
-async def main_async():
+async def main_async(args: argparse.Namespace | None = None) -> None:
     """Main CLI entry point using LangGraph."""
-    args = parse_arguments()
+    if args is None:
+        args = parse_arguments()
 
     # Handle version output
     if getattr(args, "version", False):
+        _bootstrap_path()
+        from showroom_tool import __version__
+
         print(f"showroom-tool {__version__}")
         return
 
     # Handle different commands
-    if args.command == "summary":
-        await handle_summary_command(args)
-    elif args.command == "review":
-        await handle_review_command(args)
-    elif args.command == "description":
-        await handle_description_command(args)
+    if args.command == "all":
+        await handle_command(args, *_COMMAND_TABLE.values())
+    elif args.command in _COMMAND_TABLE:
+        await handle_command(args, _COMMAND_TABLE[args.command])
     elif args.command is None:
         # No command provided - show help
-        console.print("[red]Error: No command specified[/red]")
-        console.print("\n[blue]Available commands:[/blue]")
-        console.print("  [bold]summary[/bold]     - Generate AI-powered summary of showroom content")
-        console.print("  [bold]review[/bold]      - Generate AI-powered review of showroom content")
-        console.print("  [bold]description[/bold] - Generate AI-powered catalog description of showroom content")
-        console.print("\n[dim]Use 'showroom-tool <command> --help' for detailed help on a command[/dim]")
+        console().print("[red]Error: No command specified[/red]")
+        console().print("\n[blue]Available commands:[/blue]")
+        console().print("  [bold]summary[/bold]     - Generate AI-powered summary of showroom content")
+        console().print("  [bold]review[/bold]      - Generate AI-powered review of showroom content")
+        console().print("  [bold]description[/bold] - Generate AI-powered catalog description of showroom content")
+        console().print("  [bold]all[/bold]         - Generate summary, review and catalog description in one run")
+        console().print("\n[dim]Use 'showroom-tool <command> --help' for detailed help on a command[/dim]")
         sys.exit(1)
     else:
-        console.print(f"[red]Unknown command: {args.command}[/red]")
-        console.print("[blue]Available commands: summary, review, description[/blue]")
+        console().print(f"[red]Unknown command: {args.command}[/red]")
+        console().print("[blue]Available commands: summary, review, description, all[/blue]")
         sys.exit(1)
 
 
 def main():
     """Synchronous wrapper for the async main function."""
-    asyncio.run(main_async())
+    # Parse first: --help and argument errors exit here, before asyncio is imported
+    args = parse_arguments()
+
+    import asyncio
+
+    loop_factory = None
+    if UVLOOP_AVAILABLE:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main_async(args))
 
 
 if __name__ == "__main__":
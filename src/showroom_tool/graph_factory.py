@@ -7,12 +7,15 @@ This module provides a LangGraph-based approach to fetching and processing
 Showroom repositories with proper state management and error handling.
 """
 
-from typing import Any, Literal, cast
+from typing import Any, cast
 
 from langgraph.graph import END, StateGraph
 
 from showroom_tool.basemodels import (
     CatalogDescription,
+    CommandName,
+    FinalOutput,
+    Showroom,
     ShowroomReview,
     ShowroomState,
     ShowroomSummary,
@@ -38,15 +41,19 @@ async def get_showroom(state: ShowroomState) -> dict[str, Any]:
         print("🏢 Node: Getting showroom repository data...")
 
     try:
-        # Use the existing fetch_showroom_repository function
-        showroom = fetch_showroom_repository(
-            git_url=state.git_url,
-            git_ref=state.git_ref,
-            verbose=state.verbose,
-            cache_dir=state.cache_dir,
-            no_cache=state.no_cache,
-            local_dir=state.local_dir,
-        )
+        if state.showroom is not None:
+            # The caller already fetched and parsed the repository
+            showroom = state.showroom
+        else:
+            # Use the existing fetch_showroom_repository function
+            showroom = fetch_showroom_repository(
+                git_url=state.git_url,
+                git_ref=state.git_ref,
+                verbose=state.verbose,
+                cache_dir=state.cache_dir,
+                no_cache=state.no_cache,
+                local_dir=state.local_dir,
+            )
 
         if showroom is None:
             return {
@@ -119,12 +126,15 @@ async def process_showroom(state: ShowroomState) -> dict[str, Any]:
         if command == "summary":
             system_prompt, user_content = build_showroom_summary_prompt(showroom, ShowroomSummary)
             model_class = ShowroomSummary
+            output_field = "summary_output"
         elif command == "review":
             system_prompt, user_content = build_showroom_review_prompt(showroom, ShowroomReview)
             model_class = ShowroomReview
+            output_field = "review_output"
         elif command == "description":
             system_prompt, user_content = build_showroom_description_prompt(showroom, CatalogDescription)
             model_class = CatalogDescription
+            output_field = "description_output"
         else:
             return {
                 "errors": [f"Unknown command: {command}"],
@@ -154,22 +164,19 @@ async def process_showroom(state: ShowroomState) -> dict[str, Any]:
                 },
             }
 
-        # Attach result to showroom for downstream usage
-        if command == "summary":
-            showroom.summary_output = cast(ShowroomSummary, result)
-        elif command == "review":
-            showroom.review_output = cast(ShowroomReview, result)
-        elif command == "description":
-            showroom.description_output = cast(CatalogDescription, result)
+        # Attach the result to a copy for downstream usage; the `all` command
+        # runs every verb concurrently against one shared parsed Showroom
+        showroom = showroom.model_copy(update={output_field: result})
 
-        final_output: dict[str, Any] = {
+        final_output: FinalOutput = {
             "success": True,
             "lab_name": showroom.lab_name,
             "git_url": showroom.git_url,
             "git_ref": showroom.git_ref,
             "module_count": len(showroom.modules),
             "showroom_data": showroom,
-            "structured_output": result.model_dump() if hasattr(result, "model_dump") else result,
+            # The validated model itself; callers serialize it once, at the sink
+            "structured_output": result,
             "command": command,
         }
 
@@ -210,12 +217,13 @@ async def process_showroom_with_graph(
     cache_dir: str | None = None,
     no_cache: bool = False,
     local_dir: str | None = None,
-    command: Literal["summary", "review", "description"] | None = None,
+    command: CommandName | None = None,
     llm_provider: str | None = None,
     model: str | None = None,
     temperature: float | None = None,
     prompts_file: str | None = None,
-) -> dict[str, Any]:
+    showroom: Showroom | None = None,
+) -> FinalOutput:
     """
     Process a showroom repository using the LangGraph approach.
 
@@ -225,6 +233,7 @@ async def process_showroom_with_graph(
         verbose: Enable verbose output
         cache_dir: Custom cache directory (uses default if None)
         no_cache: Disable caching and force fresh clone
+        showroom: Already-parsed Showroom to process instead of fetching git_url
 
     Returns:
         Dictionary containing processing results and showroom data
@@ -242,13 +251,14 @@ async def process_showroom_with_graph(
         model=model,
         temperature=temperature,
         prompts_file=prompts_file,
+        showroom=showroom,
         messages=[],
         errors=[],
-        final_output={},
+        final_output=FinalOutput(),
     )
 
     # Create and run graph
     graph = graph_factory(include_processing=command is not None)
     result = await graph.ainvoke(initial_state)
     # If process_showroom succeeded, final_output will be present; otherwise fallback
-    return result.get("final_output", {})
+    return cast(FinalOutput, result.get("final_output", FinalOutput()))
@@ -11,28 +11,39 @@ Requirement 11.9: Supports loading prompt and temperature overrides from
 an external file via `--prompts-file`.
 """
 
+from __future__ import annotations
+
 import importlib.util
 import json
 import os
+from functools import cache
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel
+if TYPE_CHECKING:
+    # Only needed for annotations; keeps pydantic off the import path of this module
+    from pydantic import BaseModel
 
 # Built-in default prompts (Requirement 11.11)
 try:
     from showroom_tool.config.defaults import (
+        FIELD_GUIDANCE,
         SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT,
         SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT,
         SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT,
     )
 except Exception:
     # Fallback empty strings if defaults module not available
+    FIELD_GUIDANCE = {}
     SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT = ""
     SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT = ""
     SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT = ""
 
 
+# Cached per model class: the fields and FIELD_GUIDANCE never change at runtime.
+# The build_showroom_*_structured_prompt wrappers stay uncached because the base
+# prompt they prepend can be replaced by load_prompts_overrides() mid-process.
+@cache
 def extract_field_descriptions(model_class: type[BaseModel]) -> str:
     """
     Extract field descriptions from a Pydantic model and format them with behavioral directives.
@@ -45,6 +56,7 @@ def extract_field_descriptions(model_class: type[BaseModel]) -> str:
         Formatted string with behavioral field instructions for system prompt
     """
     field_sections = []
+    guidance = FIELD_GUIDANCE.get(model_class.__name__, {})
 
     # Get model fields using model_fields (Pydantic v2)
     for field_name, field_info in model_class.model_fields.items():
@@ -52,9 +64,11 @@ def extract_field_descriptions(model_class: type[BaseModel]) -> str:
         if field_name in ["git_url", "git_ref"]:
             continue
 
-        # Get field description from Field definition
+        # Prefer the built-in guidance, then the Field definition's description
         description = ""
-        if hasattr(field_info, "description") and field_info.description:
+        if field_name in guidance:
+            description = guidance[field_name]
+        elif hasattr(field_info, "description") and field_info.description:
             description = field_info.description
         elif hasattr(field_info, "json_schema_extra") and field_info.json_schema_extra:
             # Check if description is in json_schema_extra
@@ -87,8 +101,34 @@ def _get_override(name: str, default_value: Any) -> Any:
     return PROMPTS_FILE_OVERRIDES.get(name, default_value)
 
 
+# Action -> (override key, built-in default), built once at import
+_BASE_SYSTEM_PROMPTS: dict[str, tuple[str, str]] = {
+    "summary": ("SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT", SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT),
+    "review": ("SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT", SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT),
+    "description": ("SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT", SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT),
+}
+
+# Action -> temperature override / environment variable name
+_TEMPERATURE_KEYS: dict[str, str] = {
+    "summary": "SHOWROOM_SUMMARY_TEMPERATURE",
+    "review": "SHOWROOM_REVIEW_TEMPERATURE",
+    "description": "SHOWROOM_DESCRIPTION_TEMPERATURE",
+}
+
+# Keys a prompts file is allowed to override
+_OVERRIDE_KEYS: frozenset[str] = frozenset(
+    [key for key, _ in _BASE_SYSTEM_PROMPTS.values()] + list(_TEMPERATURE_KEYS.values())
+)
+
+
+def get_base_system_prompt(action: Literal["summary", "review", "description"]) -> str:
+    """Return the base system prompt for an action, honoring prompts-file overrides."""
+    key, default = _BASE_SYSTEM_PROMPTS[action]
+    return _get_override(key, default)
+
+
 def get_summary_base_system_prompt() -> str:
-    return _get_override("SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT", SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT)
+    return get_base_system_prompt("summary")
 
 
 def get_summary_structured_prompt() -> str:
@@ -97,7 +137,7 @@ def get_summary_structured_prompt() -> str:
 
 
 def get_review_base_system_prompt() -> str:
-    return _get_override("SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT", SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT)
+    return get_base_system_prompt("review")
 
 
 def get_review_structured_prompt() -> str:
@@ -105,7 +145,7 @@ def get_review_structured_prompt() -> str:
 
 
 def get_description_base_system_prompt() -> str:
-    return _get_override("SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT", SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT)
+    return get_base_system_prompt("description")
 
 
 def get_description_structured_prompt() -> str:
@@ -370,26 +410,16 @@ def get_temperature_for_action(
     if explicit_temperature is not None:
         return float(explicit_temperature)
 
+    # Same key is used for the prompts-file override and the env var
+    specific_key = _TEMPERATURE_KEYS.get(action)
+
     # Check prompts-file overrides first
-    temperature_override_keys = {
-        "summary": "SHOWROOM_SUMMARY_TEMPERATURE",
-        "review": "SHOWROOM_REVIEW_TEMPERATURE",
-        "description": "SHOWROOM_DESCRIPTION_TEMPERATURE",
-    }
-    override_key = temperature_override_keys.get(action)
-    if override_key and override_key in PROMPTS_FILE_OVERRIDES:
+    if specific_key and specific_key in PROMPTS_FILE_OVERRIDES:
         try:
-            return float(PROMPTS_FILE_OVERRIDES[override_key])
+            return float(PROMPTS_FILE_OVERRIDES[specific_key])
         except (TypeError, ValueError):
             pass
 
-    mapping = {
-        "summary": "SHOWROOM_SUMMARY_TEMPERATURE",
-        "review": "SHOWROOM_REVIEW_TEMPERATURE",
-        "description": "SHOWROOM_DESCRIPTION_TEMPERATURE",
-    }
-
-    specific_key = mapping.get(action)
     if specific_key:
         specific_val = os.getenv(specific_key)
         if specific_val is not None and specific_val != "":
@@ -430,17 +460,7 @@ def load_prompts_overrides(file_path: str) -> None:
     PROMPTS_FILE_OVERRIDES = {}
 
     def _filter_keys(d: dict[str, Any]) -> dict[str, Any]:
-        allowed = {
-            # Prompt texts (refactored names)
-            "SHOWROOM_SUMMARY_BASE_SYSTEM_PROMPT",
-            "SHOWROOM_REVIEW_BASE_SYSTEM_PROMPT",
-            "SHOWROOM_DESCRIPTION_BASE_SYSTEM_PROMPT",
-            # Temperatures
-            "SHOWROOM_SUMMARY_TEMPERATURE",
-            "SHOWROOM_REVIEW_TEMPERATURE",
-            "SHOWROOM_DESCRIPTION_TEMPERATURE",
-        }
-        return {k: v for k, v in d.items() if k in allowed}
+        return {k: v for k, v in d.items() if k in _OVERRIDE_KEYS}
 
     if path.suffix.lower() == ".py":
         spec = importlib.util.spec_from_file_location("_showroom_prompts_overrides", str(path))
@@ -8,34 +8,40 @@ initializing LLM clients, and processing content with structured outputs.
 Based on patterns from sample-code/shared_utilities.py but adapted for showroom use.
 """
 
+import asyncio
 import json
 import os
+import sys
 import time
 from datetime import datetime
+from functools import cache
+from importlib.util import find_spec
 from typing import Any
 
 from pydantic import BaseModel
 
 from showroom_tool.basemodels import CatalogDescription, ShowroomReview, ShowroomSummary
+from showroom_tool.config.defaults import FIELD_GUIDANCE
 
-# Optional OpenAI imports for LLM functionality
-try:
-    from openai import OpenAI
-    from openai.types.chat import ChatCompletionMessageParam
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OpenAI = None
-    ChatCompletionMessageParam = None
-    OPENAI_AVAILABLE = False
+# Optional OpenAI dependency for LLM functionality. Only check that it is
+# installed here: importing openai costs a few hundred ms, so it is deferred
+# to initialize_llm and commands that never call an LLM don't pay for it.
+OPENAI_AVAILABLE = find_spec("openai") is not None
 
 
 def initialize_llm(
     llm_provider: str | None = None, model: str | None = None
-) -> tuple[Any, str]:
-    """Initialize LLM client with provider detection. Defaults to Gemini."""
+) -> tuple[Any, str, str]:
+    """
+    Initialize LLM client with provider detection. Defaults to Gemini.
+
+    Returns (client, model_name, provider) with provider lower-cased.
+    """
     if not OPENAI_AVAILABLE:
         raise ImportError("OpenAI package is not installed. Install it with 'pip install openai'")
 
+    from openai import OpenAI
+
     provider = llm_provider or os.getenv("LLM_PROVIDER", "gemini")
     provider = provider.lower()
 
@@ -47,16 +53,12 @@ def initialize_llm(
             raise ValueError(
                 "LOCAL_OPENAI_API_KEY, LOCAL_OPENAI_BASE_URL, and LOCAL_OPENAI_MODEL must be set for local provider"
             )
-        if OpenAI is None:
-            raise ImportError("OpenAI package is not installed")
         client = OpenAI(api_key=api_key, base_url=base_url)
     elif provider == "openai":
         api_key = os.getenv("OPENAI_API_KEY")
         model_name = model or os.getenv("OPENAI_MODEL", "gpt-4o-2024-08-06")
         if not api_key:
             raise ValueError("OPENAI_API_KEY must be set for openai provider")
-        if OpenAI is None:
-            raise ImportError("OpenAI package is not installed")
         client = OpenAI(api_key=api_key)
     elif provider == "gemini":
         api_key = os.getenv("GEMINI_API_KEY")
@@ -64,18 +66,18 @@ def initialize_llm(
         model_name = model or os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
         if not api_key:
             raise ValueError("GEMINI_API_KEY must be set for gemini provider")
-        if OpenAI is None:
-            raise ImportError("OpenAI package is not installed")
         client = OpenAI(api_key=api_key, base_url=base_url)
     else:
         raise ValueError(f"Unknown LLM_PROVIDER: {provider}. Supported: local, openai, gemini")
-    return client, model_name
+    return client, model_name, provider
 
 
+@cache
 def extract_field_descriptions(model_class: type[BaseModel]) -> str:
     """
     Extract field descriptions from a Pydantic model and format them with behavioral directives.
     Uses strong behavioral boundaries to prevent instruction bleeding between fields.
+    The result only depends on the class, so it is built once per model class.
 
     Args:
         model_class: The Pydantic model class to extract descriptions from
@@ -84,6 +86,7 @@ def extract_field_descriptions(model_class: type[BaseModel]) -> str:
         Formatted string with behavioral field instructions for system prompt
     """
     field_sections = []
+    guidance = FIELD_GUIDANCE.get(model_class.__name__, {})
 
     # Get model fields using model_fields (Pydantic v2)
     for field_name, field_info in model_class.model_fields.items():
@@ -91,9 +94,11 @@ def extract_field_descriptions(model_class: type[BaseModel]) -> str:
         if field_name in ["git_url", "git_ref", "summary_output"]:
             continue
 
-        # Get field description from Field definition
+        # Prefer the built-in guidance, then the Field definition's description
         description = ""
-        if hasattr(field_info, "description") and field_info.description:
+        if field_name in guidance:
+            description = guidance[field_name]
+        elif hasattr(field_info, "description") and field_info.description:
             description = field_info.description
         elif hasattr(field_info, "json_schema_extra") and field_info.json_schema_extra:
             # Check if description is in json_schema_extra
@@ -121,6 +126,25 @@ CRITICAL: Each field has its own FOCUS, IGNORE, and ACT LIKE instructions. Apply
         return ""
 
 
+@cache
+def cached_json_schema(model_class: type[BaseModel]) -> dict[str, Any]:
+    """model_class.model_json_schema(), generated once per class. Do not mutate the result."""
+    return model_class.model_json_schema()
+
+
+def _append_context_hint_lines(parts: list[str], context_hints: dict[str, Any]) -> None:
+    """Append the formatted lines for each context hint to parts (joined once by the caller)."""
+    for key, value in context_hints.items():
+        parts.append(f"{key.upper()}:\n")
+        if isinstance(value, list):
+            parts.extend(f"- {item}\n" for item in value)
+        elif isinstance(value, dict):
+            parts.extend(f"- {sub_key}: {sub_value}\n" for sub_key, sub_value in value.items())
+        elif isinstance(value, str):
+            parts.append(f"{value}\n")
+        parts.append("\n")
+
+
 def build_enhanced_system_prompt(
     base_prompt: str,
     model_class: type[BaseModel],
@@ -145,22 +169,13 @@ def build_enhanced_system_prompt(
         enhanced_prompt = base_prompt
 
     if context_hints:
-        context_section = "\n\nCONTEXT HINTS TO CONSIDER:\n"
-        context_section += "Use these hints to improve accuracy and provide additional clarity, but do not summarize them.\n\n"
-
-        for key, value in context_hints.items():
-            context_section += f"{key.upper()}:\n"
-            if isinstance(value, list):
-                for item in value:
-                    context_section += f"- {item}\n"
-            elif isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    context_section += f"- {sub_key}: {sub_value}\n"
-            elif isinstance(value, str):
-                context_section += f"{value}\n"
-            context_section += "\n"
-
-        enhanced_prompt += context_section
+        parts = [
+            enhanced_prompt,
+            "\n\nCONTEXT HINTS TO CONSIDER:\n",
+            "Use these hints to improve accuracy and provide additional clarity, but do not summarize them.\n\n",
+        ]
+        _append_context_hint_lines(parts, context_hints)
+        enhanced_prompt = "".join(parts)
 
     return enhanced_prompt
 
@@ -185,22 +200,13 @@ def build_context_enhanced_system_prompt(
     enhanced_prompt = base_prompt
 
     if context_hints:
-        context_section = "\n\nCONTEXT HINTS TO CONSIDER (but do not summarize):\n"
-        context_section += "Use these hints to improve accuracy, but do not include them in your summary.\n\n"
-
-        for key, value in context_hints.items():
-            context_section += f"{key.upper()}:\n"
-            if isinstance(value, list):
-                for item in value:
-                    context_section += f"- {item}\n"
-            elif isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    context_section += f"- {sub_key}: {sub_value}\n"
-            elif isinstance(value, str):
-                context_section += f"{value}\n"
-            context_section += "\n"
-
-        enhanced_prompt += context_section
+        parts = [
+            enhanced_prompt,
+            "\n\nCONTEXT HINTS TO CONSIDER (but do not summarize):\n",
+            "Use these hints to improve accuracy, but do not include them in your summary.\n\n",
+        ]
+        _append_context_hint_lines(parts, context_hints)
+        enhanced_prompt = "".join(parts)
 
     return enhanced_prompt
 
@@ -242,9 +248,7 @@ async def process_content_with_structured_output(
     start_time = time.monotonic()
 
     try:
-        client, model_name = initialize_llm(llm_provider, model)
-        provider = llm_provider or os.getenv("LLM_PROVIDER", "gemini")
-        provider = provider.lower()
+        client, model_name, provider = initialize_llm(llm_provider, model)
 
         # Enhance system prompt with field descriptions and context hints
         enhanced_system_prompt = build_enhanced_system_prompt(
@@ -272,14 +276,16 @@ async def process_content_with_structured_output(
                 print(content_str)
             print("=" * 60)
             print("\n🔧 STRUCTURED OUTPUT SCHEMA:")
-            print(json.dumps(model_class.model_json_schema(), indent=2))
+            print(json.dumps(cached_json_schema(model_class), indent=2))
             print("=" * 60)
 
         print("🔄 Calling LLM with structured output..." if verbose else "", end="")
 
-        # Use the responses API for structured output
+        # Use the responses API for structured output; the client is synchronous,
+        # so run it on a worker thread to let concurrent requests overlap
         final_temperature = temperature if temperature is not None else float(os.getenv("LLM_TEMPERATURE", "0.1"))
-        response = client.beta.chat.completions.parse(
+        response = await asyncio.to_thread(
+            client.beta.chat.completions.parse,
             model=model_name,
             messages=messages,
             response_format=model_class,
@@ -293,7 +299,7 @@ async def process_content_with_structured_output(
 
             if verbose:
                 print("\n📥 SUCCESS - Structured Output Generated:")
-                print(json.dumps(structured_output.model_dump(), indent=2))
+                print(structured_output.model_dump_json(indent=2))
                 print("=" * 60)
 
             metadata = {
@@ -351,15 +357,29 @@ def save_structured_output(
     Returns:
         Path to the saved file
     """
-    # Ensure save directory exists
+    full_path = _timestamped_output_path(content_type, save_path)
+
+    with open(full_path, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+    return full_path
+
+
+def _timestamped_output_path(content_type: str, save_path: str) -> str:
+    """Create save_path if needed and return a timestamped summary filename in it."""
     os.makedirs(save_path, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"summary_{content_type}_{timestamp}.json"
-    full_path = os.path.join(save_path, filename)
+    return os.path.join(save_path, filename)
+
+
+def _save_model_json(model: BaseModel, content_type: str, save_path: str) -> str:
+    """Write a model straight to disk via pydantic-core, skipping the dict round-trip."""
+    full_path = _timestamped_output_path(content_type, save_path)
 
     with open(full_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+        f.write(model.model_dump_json(indent=2))
 
     return full_path
 
@@ -380,27 +400,25 @@ def save_summary_to_workspace(
     # Extract content type from the summary (default to "showroom")
     content_type = "showroom"
 
-    # Convert to dict for saving
-    summary_dict = summary.model_dump()
-
-    # Save using the existing function
-    return save_structured_output(summary_dict, content_type, save_path)
+    return _save_model_json(summary, content_type, save_path)
 
 
 def print_basemodel(model: BaseModel, title: str = "Model Output") -> None:
     """Print any BaseModel in a formatted way - works dynamically with any model."""
-    print(f"✅ {title}")
-    model_dict = model.model_dump()
-    print(json.dumps(model_dict, indent=2, ensure_ascii=False))
+    parts = [f"✅ {title}\n", model.model_dump_json(indent=2), "\n"]
 
     # Print summary stats for list fields
     list_fields = []
-    for field_name, field_value in model_dict.items():
-        if isinstance(field_value, list):
+    for field_name in type(model).model_fields:
+        field_value = getattr(model, field_name)
+        if isinstance(field_value, list | tuple):
             list_fields.append(f"{field_name}: {len(field_value)} items")
 
     if list_fields:
-        print(f"📊 Summary: {', '.join(list_fields)}")
+        parts.append(f"📊 Summary: {', '.join(list_fields)}\n")
+
+    # One write for the whole block
+    sys.stdout.write("".join(parts))
 
 
 def format_showroom_content_for_prompt(showroom_data) -> str:
@@ -498,11 +516,7 @@ def save_review_to_workspace(
     # Extract content type from the review (default to "showroom")
     content_type = "showroom_review"
 
-    # Convert to dict for saving
-    review_dict = review.model_dump()
-
-    # Save using the existing function
-    return save_structured_output(review_dict, content_type, save_path)
+    return _save_model_json(review, content_type, save_path)
 
 
 def build_showroom_review_prompt(
@@ -574,11 +588,7 @@ def save_description_to_workspace(
     # Extract content type from the description (default to "showroom")
     content_type = "showroom_description"
 
-    # Convert to dict for saving
-    description_dict = description.model_dump()
-
-    # Save using the existing function
-    return save_structured_output(description_dict, content_type, save_path)
+    return _save_model_json(description, content_type, save_path)
 
 
 def build_showroom_description_prompt(
@@ -8,6 +8,7 @@ including caching, git operations, and content processing.
 """
 
 import hashlib
+import os
 import re
 import shutil
 import tempfile
@@ -20,16 +21,23 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # Try to import from the installed package structure
 try:
-    from showroom_tool.basemodels import Showroom, ShowroomModule
+    from showroom_tool import __version__
+    from showroom_tool.basemodels import Showroom, validate_modules
 except ImportError:
     # Fall back to adding src to path (for development)
     import sys
     project_root = Path(__file__).parent.parent.parent
     sys.path.insert(0, str(project_root / "src"))
-    from showroom_tool.basemodels import Showroom, ShowroomModule
+    from showroom_tool import __version__
+    from showroom_tool.basemodels import Showroom, validate_modules
 
 console = Console()
 
+# Bump when parsing or the Showroom model changes in a way old cache entries
+# would still validate against; together with the tool version it names the
+# parsed-cache directory, so upgrades never serve an older parse
+PARSED_CACHE_VERSION = 1
+
 
 # Cache Management Functions
 
@@ -283,13 +291,51 @@ def get_or_clone_repository(
         return None
 
 
+def get_parsed_cache_path(repo_path: Path) -> Path | None:
+    """Path of the parsed-Showroom cache entry for the commit checked out in repo_path."""
+    try:
+        commit = git.Repo(repo_path).head.commit.hexsha
+    except Exception:
+        return None
+    # Keyed by clone (URL + ref) and commit, so a moved branch never hits a stale entry
+    version_dir = f"{__version__}-{PARSED_CACHE_VERSION}"
+    return repo_path.parent / "parsed" / version_dir / f"{repo_path.name}-{commit}.json"
+
+
+def load_parsed_showroom(cache_path: Path) -> Showroom | None:
+    """Load a cached Showroom, or None if the entry is missing or unreadable."""
+    try:
+        return Showroom.model_validate_json(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def save_parsed_showroom(cache_path: Path, showroom: Showroom) -> None:
+    """Atomically write a parsed Showroom to the cache and drop entries for older commits."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(showroom.model_dump_json())
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+        return
+
+    clone_name = cache_path.name.rsplit("-", 1)[0]
+    for stale in cache_path.parent.glob(f"{clone_name}-*.json"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+
 # Content Processing Functions
 
 def count_words_and_lines(content: str) -> tuple[int, int]:
     """Count words and lines in content, excluding empty lines."""
-    lines = [line.strip() for line in content.split("\n") if line.strip()]
+    # Count blank lines in place instead of building a list of stripped copies
+    lines = sum(1 for line in content.split("\n") if line and not line.isspace())
     words = len(content.split())
-    return words, len(lines)
+    return words, lines
 
 
 def extract_lab_info_from_site_yaml(repo_path: Path) -> tuple[str, str]:
@@ -450,6 +496,18 @@ def fetch_showroom_repository(
     if repo_path is None:
         return None
 
+    # Parsed results are cached next to cached clones only; --dir and --no-cache
+    # always parse the working tree
+    parsed_cache_path = None
+    if not local_dir and not no_cache:
+        parsed_cache_path = get_parsed_cache_path(repo_path)
+        if parsed_cache_path is not None:
+            cached = load_parsed_showroom(parsed_cache_path)
+            if cached is not None:
+                if verbose:
+                    console.print(f"[green]Using parsed showroom cache: {parsed_cache_path}[/green]")
+                return cached
+
     try:
         # Extract lab name and start page from default-site.yml
         lab_name, start_page = extract_lab_info_from_site_yaml(repo_path)
@@ -470,7 +528,7 @@ def fetch_showroom_repository(
                 "[blue]Navigation parsing - level 1 entries only, duplicates removed[/blue]"
             )
 
-        # Read each module file and create ShowroomModule instances
+        # Read each module file; modules are validated together once all are read
         pages_dir = repo_path / "content" / "modules" / "ROOT" / "pages"
         modules = []
 
@@ -482,12 +540,13 @@ def fetch_showroom_repository(
                 if not module_name and filename == start_page and lab_name:
                     module_name = lab_name
 
-                showroom_module = ShowroomModule(
-                    module_name=module_name,
-                    filename=filename,
-                    module_content=module_content,
+                modules.append(
+                    {
+                        "module_name": module_name,
+                        "filename": filename,
+                        "module_content": module_content,
+                    }
                 )
-                modules.append(showroom_module)
 
                 if verbose:
                     word_count, line_count = count_words_and_lines(module_content)
@@ -502,13 +561,18 @@ def fetch_showroom_repository(
                     )
 
         # Create and return the Showroom instance
-        showroom = Showroom(
+        # Validate all modules in one pass; the Showroom itself is trusted data
+        # from our own parser, so skip re-validation
+        showroom = Showroom.from_trusted(
             lab_name=lab_name,
             git_url=effective_git_url,
             git_ref=git_ref if not local_dir else "(local)",
-            modules=modules,
+            modules=validate_modules(modules),
         )
 
+        if parsed_cache_path is not None:
+            save_parsed_showroom(parsed_cache_path, showroom)
+
         if verbose:
             console.print(
                 f"[green]Successfully fetched showroom lab: '{lab_name}' with {len(modules)} modules[/green]"
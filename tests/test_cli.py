@@ -0,0 +1,254 @@
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# Ensure src/ is importable in tests without editable install
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+
+from showroom_tool import cli  # noqa: E402
+from showroom_tool.basemodels import (  # noqa: E402
+    CatalogDescription,
+    Showroom,
+    ShowroomModule,
+    ShowroomReview,
+    ShowroomSummary,
+)
+
+REPO_URL = "https://example.com/repo.git"
+
+FAKE_OUTPUTS: dict[type, Any] = {
+    ShowroomSummary: ShowroomSummary(
+        redhat_products=("Red Hat OpenShift",),
+        lab_audience=("Developers",),
+        lab_learning_objectives=("Deploy an application",),
+        lab_summary="A short lab about deploying an application.",
+    ),
+    ShowroomReview: ShowroomReview(
+        completeness_feedback="Complete.",
+        clarity_feedback="Clear.",
+        technical_detail_feedback="Detailed.",
+        usefulness_feedback="Useful.",
+        business_value_feedback="Valuable.",
+        review_summary="A solid lab.",
+    ),
+    CatalogDescription: CatalogDescription(
+        headline="Deploy your first application.",
+        content_type="lab",
+        products=("Red Hat OpenShift",),
+        intended_audience_bullets=("Developers",),
+        lab_bullets=("Deploy an application",),
+    ),
+}
+
+
+@pytest.fixture
+def fake_showroom(monkeypatch: pytest.MonkeyPatch) -> Showroom:
+    """Serve a fixed Showroom and canned LLM outputs instead of git and a provider."""
+    from showroom_tool import graph_factory as gf
+
+    showroom = Showroom(
+        lab_name="Dummy Lab",
+        git_url=REPO_URL,
+        git_ref="main",
+        modules=[ShowroomModule(module_name="Intro", filename="index.adoc", module_content="= Intro\nHello")],
+    )
+
+    async def fake_llm(*, model_class: type, **kwargs: Any) -> tuple[Any, bool, dict[str, Any]]:
+        return FAKE_OUTPUTS[model_class], True, {}
+
+    monkeypatch.setattr(gf, "fetch_showroom_repository", lambda **kwargs: showroom)
+    monkeypatch.setattr(gf, "process_content_with_structured_output", fake_llm)
+    return showroom
+
+
+@pytest.mark.asyncio
+async def test_all_command_emits_each_output_keyed_by_command(
+    fake_showroom: Showroom, capsys: pytest.CaptureFixture[str]
+) -> None:
+    await cli.main_async(cli.parse_arguments(["all", REPO_URL, "--output", "json"]))
+
+    payload = json.loads(capsys.readouterr().out)
+    assert list(payload) == ["summary", "review", "description"]
+    assert ShowroomSummary.model_validate(payload["summary"]) == FAKE_OUTPUTS[ShowroomSummary]
+    assert ShowroomReview.model_validate(payload["review"]) == FAKE_OUTPUTS[ShowroomReview]
+    assert CatalogDescription.model_validate(payload["description"]) == FAKE_OUTPUTS[CatalogDescription]
+    # The runs share one parsed Showroom; none of them may write onto it
+    assert fake_showroom.summary_output is None
+    assert fake_showroom.review_output is None
+    assert fake_showroom.description_output is None
+
+
+# Command -> (model, text from FAKE_OUTPUTS that every output format shows)
+COMMANDS = {
+    "summary": (ShowroomSummary, "A short lab about deploying an application."),
+    "review": (ShowroomReview, "A solid lab."),
+    "description": (CatalogDescription, "Deploy your first application."),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("command", list(COMMANDS))
+async def test_command_json_output(
+    fake_showroom: Showroom, capsys: pytest.CaptureFixture[str], command: str
+) -> None:
+    model, _ = COMMANDS[command]
+
+    await cli.main_async(cli.parse_arguments([command, REPO_URL, "--output", "json"]))
+
+    assert model.model_validate_json(capsys.readouterr().out) == FAKE_OUTPUTS[model]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("command", list(COMMANDS))
+async def test_command_adoc_output(
+    fake_showroom: Showroom, capsys: pytest.CaptureFixture[str], command: str
+) -> None:
+    pytest.importorskip("jinja2")
+    _, text = COMMANDS[command]
+
+    await cli.main_async(cli.parse_arguments([command, REPO_URL, "--output", "adoc"]))
+
+    out = capsys.readouterr().out
+    assert text in out
+    assert not out.lstrip().startswith("{")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("command", list(COMMANDS))
+async def test_command_verbose_output_saves_to_workspace(
+    fake_showroom: Showroom,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    command: str,
+) -> None:
+    model, text = COMMANDS[command]
+    monkeypatch.chdir(tmp_path)
+
+    await cli.main_async(cli.parse_arguments([command, REPO_URL]))
+
+    out = capsys.readouterr().out
+    assert cli._COMMAND_TABLE[command].title in out
+    assert text in out
+    saved = list((tmp_path / "workspace").iterdir())
+    assert len(saved) == 1
+    assert model.model_validate_json(saved[0].read_text(encoding="utf-8")) == FAKE_OUTPUTS[model]
+
+
+def test_command_loaders_resolve() -> None:
+    for command, (model, _) in COMMANDS.items():
+        impl = cli._COMMAND_TABLE[command].load()
+        assert impl.model is model
+        assert callable(impl.build_prompt) and callable(impl.save)
+
+
+@pytest.fixture
+def fetch_calls(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    """Record repository fetches; argument errors must exit before any."""
+    calls: list[Any] = []
+
+    async def fake_fetch(args: Any) -> None:
+        calls.append(args)
+        raise AssertionError("fetch_showroom_data should not be reached")
+
+    monkeypatch.setattr(cli, "fetch_showroom_data", fake_fetch)
+    return calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("output", ["json", "verbose"])
+async def test_missing_repository_exits_before_fetch(
+    fetch_calls: list[Any], capsys: pytest.CaptureFixture[str], output: str
+) -> None:
+    with pytest.raises(SystemExit) as exc:
+        await cli.main_async(cli.parse_arguments(["summary", "--output", output]))
+
+    assert exc.value.code == 1
+    assert fetch_calls == []
+    captured = capsys.readouterr()
+    stream = captured.err if output == "json" else captured.out
+    assert "Repository URL or --dir PATH is required" in stream
+
+
+@pytest.mark.asyncio
+async def test_adoc_without_jinja2_exits_before_fetch(
+    fetch_calls: list[Any], capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from showroom_tool import outputs
+
+    monkeypatch.setattr(outputs, "check_jinja2_availability", lambda: False)
+
+    with pytest.raises(SystemExit) as exc:
+        await cli.main_async(cli.parse_arguments(["review", REPO_URL, "--output", "adoc"]))
+
+    assert exc.value.code == 1
+    assert fetch_calls == []
+    assert "Jinja2 is required" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("output", ["json", "adoc"])
+async def test_error_boundary_reports_on_stderr_for_clean_output(
+    capfd: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch, output: str
+) -> None:
+    async def failing_fetch(args: Any) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(cli, "fetch_showroom_data", failing_fetch)
+
+    with pytest.raises(SystemExit) as exc:
+        await cli.main_async(cli.parse_arguments(["summary", REPO_URL, "--output", output]))
+
+    assert exc.value.code == 1
+    captured = capfd.readouterr()
+    assert captured.err == "Error: boom\n"
+    assert captured.out == ""
+
+
+@pytest.mark.asyncio
+async def test_error_boundary_reports_on_console_for_verbose_output(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def failing_fetch(args: Any) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(cli, "fetch_showroom_data", failing_fetch)
+
+    with pytest.raises(SystemExit) as exc:
+        await cli.main_async(cli.parse_arguments(["summary", REPO_URL]))
+
+    assert exc.value.code == 1
+    assert "Error during AI processing: boom" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["summary", REPO_URL], "summary"),
+        (["--version"], None),
+        (["--output", "json", "all", REPO_URL], "all"),
+        (["review", REPO_URL, "--model", "summary"], "review"),
+        (["description", "--help"], None),
+        (["-h"], None),
+        (["bogus"], None),
+    ],
+)
+def test_sniff_subcommand(argv: list[str], expected: str | None) -> None:
+    assert cli._sniff_subcommand(argv) == expected
+
+
+@pytest.mark.parametrize("command", [*COMMANDS, "all"])
+def test_parse_arguments_builds_requested_subcommand(command: str) -> None:
+    args = cli.parse_arguments([command, REPO_URL, "--output", "json", "--llm-provider", "openai"])
+
+    assert args.command == command
+    assert args.repo_url == REPO_URL
+    assert args.output == "json"
+    assert args.llm_provider == "openai"
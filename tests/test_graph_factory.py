@@ -11,7 +11,13 @@ if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
 
-from showroom_tool.basemodels import Showroom, ShowroomModule  # noqa: E402
+from showroom_tool.basemodels import (  # noqa: E402
+    CatalogDescription,
+    Showroom,
+    ShowroomModule,
+    ShowroomReview,
+    ShowroomSummary,
+)
 
 
 @pytest.mark.asyncio
@@ -56,3 +62,39 @@ async def test_graph_fetch_only_flow(monkeypatch: pytest.MonkeyPatch) -> None:
     assert result.get("module_count") == 1
     assert "showroom_data" in result
 
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_do_not_share_outputs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Runs given the same Showroom each attach only their own result, to a copy."""
+    import asyncio
+
+    from showroom_tool import graph_factory as gf
+
+    async def fake_llm(*, model_class: type, **kwargs: Any) -> tuple[Any, bool, dict[str, Any]]:
+        await asyncio.sleep(0)
+        return model_class.model_construct(), True, {}
+
+    monkeypatch.setattr(gf, "process_content_with_structured_output", fake_llm)
+    shared = Showroom(
+        lab_name="Dummy Lab",
+        git_url="https://example.com/repo.git",
+        git_ref="main",
+        modules=[ShowroomModule(module_name="Intro", filename="index.adoc", module_content="= Intro\nHello")],
+    )
+
+    summary, review, description = await asyncio.gather(
+        *(
+            gf.process_showroom_with_graph(git_url=shared.git_url, command=command, showroom=shared)
+            for command in ("summary", "review", "description")
+        )
+    )
+
+    assert isinstance(summary["structured_output"], ShowroomSummary)
+    assert isinstance(review["structured_output"], ShowroomReview)
+    assert isinstance(description["structured_output"], CatalogDescription)
+    assert summary["showroom_data"].summary_output is summary["structured_output"]
+    assert summary["showroom_data"].review_output is None
+    assert review["showroom_data"].summary_output is None
+    assert description["showroom_data"].description_output is description["structured_output"]
+    assert shared.summary_output is shared.review_output is shared.description_output is None
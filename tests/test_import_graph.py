@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Ensure src/ is importable in tests without editable install
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_PATH = PROJECT_ROOT / "src"
+
+# Modules the CLI must only pull in once a command actually runs
+HEAVY_MODULES = (
+    "asyncio",
+    "git",
+    "httpx",
+    "langgraph",
+    "openai",
+    "pydantic",
+    "rich.console",
+    "showroom_tool.basemodels",
+    "showroom_tool.graph_factory",
+    "showroom_tool.showroom",
+    "yaml",
+)
+
+
+def _run_fresh(script: str) -> subprocess.CompletedProcess[str]:
+    # Run in a fresh interpreter so modules loaded by other tests don't leak in
+    return subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": str(SRC_PATH)},
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_sample_code_not_imported_by_package() -> None:
+    result = _run_fresh(
+        "import sys\n"
+        "import showroom_tool.cli\n"
+        "loaded = [m.__name__ for m in list(sys.modules.values())\n"
+        "          if 'sample-code' in (getattr(m, '__file__', None) or '')]\n"
+        "assert not loaded, loaded\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_cli_import_and_argument_parsing_defer_heavy_modules() -> None:
+    result = _run_fresh(
+        "import sys\n"
+        "from showroom_tool import cli\n"
+        "cli.parse_arguments(['summary', 'https://github.com/example/showroom'])\n"
+        f"loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    assert result.returncode == 0, result.stderr
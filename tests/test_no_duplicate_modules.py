@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Ensure src/ is importable in tests without editable install
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_PATH = PROJECT_ROOT / "src"
+
+
+def test_models_module_loaded_once_across_consumers() -> None:
+    # Fresh interpreter run from the project root, where src/ is also importable
+    # as a namespace package: a consumer reaching the models through a second
+    # import path would load basemodels.py twice and rebuild every schema
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "import pydantic\n"
+        "from showroom_tool import cli, graph_factory, outputs, shared_utilities, showroom\n"
+        "target = Path('src/showroom_tool/basemodels.py').resolve()\n"
+        "copies = [name for name, m in list(sys.modules.items())\n"
+        "          if getattr(m, '__file__', None) and Path(m.__file__).resolve() == target]\n"
+        "assert copies == ['showroom_tool.basemodels'], copies\n"
+        "basemodels = sys.modules['showroom_tool.basemodels']\n"
+        "for module in (cli, graph_factory, outputs, shared_utilities, showroom):\n"
+        "    for name, obj in vars(module).items():\n"
+        "        if isinstance(obj, type) and issubclass(obj, pydantic.BaseModel) and hasattr(basemodels, name):\n"
+        "            assert obj is getattr(basemodels, name), (module.__name__, name)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC_PATH), str(PROJECT_ROOT)])},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+import git
+import pytest
+
+# Ensure src/ is importable in tests without editable install
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+
+def _make_origin(tmp_path: Path) -> git.Repo:
+    """Minimal showroom repo used as the clone source."""
+    origin = tmp_path / "origin"
+    pages_dir = origin / "content" / "modules" / "ROOT" / "pages"
+    pages_dir.mkdir(parents=True)
+    (origin / "default-site.yml").write_text(
+        "site:\n  title: Test Lab\n  start_page: index.adoc\n", encoding="utf-8"
+    )
+    (pages_dir.parent / "nav.adoc").write_text("* xref:index.adoc[Intro]", encoding="utf-8")
+    (pages_dir / "index.adoc").write_text("= Intro\nHello world", encoding="utf-8")
+    repo = git.Repo.init(origin)
+    repo.index.add(["default-site.yml", "content"])
+    repo.index.commit("initial")
+    return repo
+
+
+def test_parsed_showroom_is_cached_per_commit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from showroom_tool import showroom as sr
+
+    repo = _make_origin(tmp_path)
+    cache_dir = tmp_path / "cache"
+    first = sr.fetch_showroom_repository(git_url=repo.working_dir, git_ref="HEAD", cache_dir=str(cache_dir))
+    assert first is not None
+
+    entries = list((cache_dir / "parsed").rglob("*.json"))
+    assert len(entries) == 1
+    assert entries[0].name.endswith(f"-{repo.head.commit.hexsha}.json")
+    assert entries[0].parent.name == f"{sr.__version__}-{sr.PARSED_CACHE_VERSION}"
+
+    # A hit must not parse the checkout again
+    parse_calls = []
+    real_parse = sr.parse_navigation_file
+
+    def counting_parse(nav_path: Path) -> list[str]:
+        parse_calls.append(nav_path)
+        return real_parse(nav_path)
+
+    monkeypatch.setattr(sr, "parse_navigation_file", counting_parse)
+    second = sr.fetch_showroom_repository(git_url=repo.working_dir, git_ref="HEAD", cache_dir=str(cache_dir))
+    assert second == first
+    assert parse_calls == []
+
+    # A new parser version ignores entries written by the old one
+    monkeypatch.setattr(sr, "PARSED_CACHE_VERSION", sr.PARSED_CACHE_VERSION + 1)
+    third = sr.fetch_showroom_repository(git_url=repo.working_dir, git_ref="HEAD", cache_dir=str(cache_dir))
+    assert third == first
+    assert len(parse_calls) == 1
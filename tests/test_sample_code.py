@@ -0,0 +1,240 @@
+import importlib.util
+import sys
+import types
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+# sample-code/ is reference code that imports its models as config.basemodels;
+# load it from its files under those names instead of installing it
+PROJECT_ROOT = Path(__file__).parent.parent
+SAMPLE_CODE_PATH = PROJECT_ROOT / "sample-code"
+
+
+def _load_sample_module(filename: str, module_name: str) -> types.ModuleType:
+    spec = importlib.util.spec_from_file_location(module_name, SAMPLE_CODE_PATH / filename)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def sample_code() -> Iterator[types.SimpleNamespace]:
+    saved = {name: sys.modules.get(name) for name in ("config", "config.basemodels", "sample_shared_utilities")}
+    config = types.ModuleType("config")
+    config.__path__ = []  # type: ignore[attr-defined]
+    sys.modules["config"] = config
+    basemodels = _load_sample_module("basemodels.py", "config.basemodels")
+    config.basemodels = basemodels  # type: ignore[attr-defined]
+    shared_utilities = _load_sample_module("shared_utilities.py", "sample_shared_utilities")
+    yield types.SimpleNamespace(basemodels=basemodels, shared_utilities=shared_utilities)
+    for name, module in saved.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+
+
+@pytest.mark.asyncio
+async def test_lxml_text_decodes_utf8_without_charset_header(sample_code: types.SimpleNamespace) -> None:
+    import httpx
+
+    body = "<html><body><p>Café — naïve 日本語</p></body></html>".encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/html"}, content=body)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        async with client.stream("GET", "https://example.com/") as response:
+            assert response.charset_encoding is None
+            text = await sample_code.shared_utilities._stream_text_lxml(response)
+
+    assert "Café — naïve 日本語" in text
+
+
+NEWS_WIRE = "LONDON (Reuters) - Shares in European banks rose sharply on Tuesday after ...\n"
+NEWS_BYLINE = (
+    "Senate passes budget bill\n"
+    "By Jane Doe\n"
+    "\n"
+    "WASHINGTON — The Senate voted late on Tuesday to pass the spending bill after weeks of talks.\n"
+)
+TECH_WITH_BYLINE = (
+    "Tuning PostgreSQL autovacuum\n"
+    "By Jane Doe\n"
+    "\n"
+    "Autovacuum keeps table bloat in check. In this article we walk through the settings.\n"
+    "API - the pg_stat_user_tables view shows dead tuples per table.\n"
+)
+AP_MODE = "AP mode lets the device act as a wireless access point.\nConfigure it with nmcli.\n"
+
+
+@pytest.mark.parametrize("content", [NEWS_WIRE, NEWS_BYLINE])
+def test_fast_classify_skips_llm_for_news_signatures(sample_code: types.SimpleNamespace, content: str) -> None:
+    su = sample_code.shared_utilities
+    label, confidence = su._fast_classify(content)
+    assert label == "news_article"
+    assert confidence >= su.FAST_CLASSIFY_MIN_CONFIDENCE
+
+
+@pytest.mark.parametrize("content", [TECH_WITH_BYLINE, AP_MODE])
+def test_fast_classify_defers_weak_signatures_to_llm(sample_code: types.SimpleNamespace, content: str) -> None:
+    su = sample_code.shared_utilities
+    fast = su._fast_classify(content)
+    assert fast is None or fast[1] < su.FAST_CLASSIFY_MIN_CONFIDENCE
+
+
+@pytest.mark.asyncio
+async def test_rank_content_types_asks_llm_for_bylined_article(
+    sample_code: types.SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    su = sample_code.shared_utilities
+    detection = sample_code.basemodels.ContentTypeDetection
+    calls = []
+
+    async def fake_llm(**kwargs):
+        calls.append(kwargs)
+        return detection.model_construct(content_type="technical_article", confidence=0.95, runner_up_type=None), True, {}
+
+    monkeypatch.setattr(su, "process_content_with_structured_output", fake_llm)
+    ranked = await su.rank_content_types(TECH_WITH_BYLINE)
+
+    assert len(calls) == 1
+    assert ranked[0] == ("technical_article", 0.95)
+
+
+def test_context_hint_keeps_user_dicts_with_a_kind_key(sample_code: types.SimpleNamespace) -> None:
+    context_hint = sample_code.basemodels.ContextHint
+
+    hint = context_hint(hint_label="event", hint_data={"kind": "workshop", "audience": "developers"})
+    assert hint.hint_data.kind == "dict"
+    assert hint.hint_data.value == {"kind": "workshop", "audience": "developers"}
+
+    # Already-tagged payloads (e.g. a dumped hint) still dispatch on their tag
+    tagged = context_hint(hint_label="names", hint_data={"kind": "list_str", "value": ["a", "b"]})
+    assert tagged.hint_data.kind == "list_str"
+    assert tagged.hint_data.value == ["a", "b"]
+
+
+@pytest.mark.parametrize("summary_type", ["MeetingSummary", "TechnicalArticleSummary", "NewsArticleSummary"])
+def test_derived_extraction_models_keep_overview_min_length(
+    sample_code: types.SimpleNamespace, summary_type: str
+) -> None:
+    import pydantic
+
+    summary_cls = getattr(sample_code.basemodels, summary_type)
+    shared = sample_code.shared_utilities
+    for derived in (shared._single_field_model(summary_cls, "overview"), shared._batched_fields_model(summary_cls)):
+        assert derived.model_json_schema()["properties"]["overview"]["minLength"] == 10
+        with pytest.raises(pydantic.ValidationError):
+            derived.model_validate({"overview": "too short"})
+
+
+@pytest.mark.asyncio
+async def test_llm_cache_hit_reports_fresh_metadata(
+    sample_code: types.SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from collections import OrderedDict
+    from datetime import datetime
+
+    su = sample_code.shared_utilities
+    bm = sample_code.basemodels
+    original_metadata = bm.ProcessingMetadata(
+        timestamp="2020-01-01T00:00:00", llm_provider="fake", model_name="fake-model", processing_duration=12.5, success=True
+    )
+    summary = bm.MeetingSummary(overview="Quarterly planning meeting outcomes.", processing_metadata=original_metadata)
+    parse_calls = []
+
+    def parse(**kwargs):
+        parse_calls.append(kwargs)
+        message = types.SimpleNamespace(parsed=summary.model_copy(deep=True), content="")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    client = types.SimpleNamespace(beta=types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(parse=parse))))
+    monkeypatch.setattr(su, "initialize_llm", lambda *args: (client, "fake-model", "fake"))
+    monkeypatch.setattr(su, "_LLM_RESPONSE_CACHE", OrderedDict())
+
+    first, ok, first_meta = await su.process_content_with_structured_output("notes", bm.MeetingSummary, "Summarize.")
+    assert ok and "cached" not in first_meta
+    cached, ok, cached_meta = await su.process_content_with_structured_output("notes", bm.MeetingSummary, "Summarize.")
+
+    assert ok and len(parse_calls) == 1
+    assert cached_meta["cached"] is True
+    assert cached_meta["processing_duration"] == 0.0
+    assert cached.overview == first.overview
+    assert cached.processing_metadata.processing_duration == 0.0
+    assert datetime.fromisoformat(cached.processing_metadata.timestamp) >= datetime.fromisoformat(
+        first.processing_metadata.timestamp
+    )
+    assert cached.processing_metadata.note
+
+
+def test_processing_metadata_accepts_any_timestamp_string(sample_code: types.SimpleNamespace) -> None:
+    metadata_cls = sample_code.basemodels.ProcessingMetadata
+
+    # Part of the LLM response schema: a provider's free-form timestamp must not fail the parse
+    assert metadata_cls.model_json_schema()["properties"]["timestamp"]["type"] == "string"
+    metadata = metadata_cls(timestamp="just now", llm_provider="fake", model_name="fake-model", success=True)
+    assert metadata.timestamp == "just now"
+
+
+@pytest.mark.asyncio
+async def test_http_session_shares_and_closes_one_client(
+    sample_code: types.SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import httpx
+
+    su = sample_code.shared_utilities
+    created: list[httpx.AsyncClient] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = b"<html><body><p>Hello from the mock</p></body></html>"
+        return httpx.Response(200, headers={"Content-Type": "text/html; charset=utf-8"}, content=body)
+
+    def new_client() -> httpx.AsyncClient:
+        created.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        return created[-1]
+
+    monkeypatch.setattr(su, "_new_http_client", new_client)
+
+    async with su.http_session() as client:
+        assert "Hello from the mock" in await su.extract_text_from_url("https://example.com/a")
+        assert "Hello from the mock" in await su.extract_text_from_url("https://example.com/b")
+        async with su.http_session() as nested:
+            assert nested is client
+    assert created == [client]
+    assert client.is_closed
+
+    # Outside a session each fetch owns a client and closes it before returning
+    await su.extract_text_from_url("https://example.com/c")
+    assert len(created) == 2
+    assert created[1].is_closed
+
+
+@pytest.mark.asyncio
+async def test_extracted_page_text_is_whitespace_collapsed(
+    sample_code: types.SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import httpx
+
+    su = sample_code.shared_utilities
+    body = (
+        "<html><body>\n"
+        "  <h1>Release &nbsp; notes</h1>\n"
+        "  <p>First\tline\nsecond line</p>\n\n\n"
+        "  <ul><li>one</li>\n<li>two</li></ul>\n"
+        "</body></html>"
+    ).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/html; charset=utf-8"}, content=body)
+
+    monkeypatch.setattr(su, "_new_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    text = await su.extract_text_from_url("https://example.com/notes")
+
+    # One line, single spaces: newlines, tabs, NBSP and space runs all fold to " "
+    assert text == "Release notes First line second line one two"